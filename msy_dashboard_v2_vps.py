@@ -1,29 +1,278 @@
 #!/usr/bin/env python3
 import os
-from http.server import BaseHTTPRequestHandler, HTTPServer
+import gzip
+import json
+import time
+import hashlib
+import queue
+import socket
+import threading
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from datetime import datetime
+from urllib.parse import parse_qs, urlsplit
+
+from msy_genesy_shared import MSYAggregatesReader, MSYEventReader, MSYMetricsReader, summarize_aggregates
+
+# Rafraîchissement du statut pré-sérialisé (secondes)
+STATUS_REFRESH_SECONDS = float(os.environ.get("MSY_STATUS_REFRESH", "1.0"))
+
+# Connexion keep-alive inactive fermée après N secondes (libère le thread)
+HANDLER_TIMEOUT_SECONDS = float(os.environ.get("MSY_HANDLER_TIMEOUT", "30"))
+
+# Flux SSE GENESY
+SSE_CLIENT_BUFFER = int(os.environ.get("MSY_SSE_BUFFER", "256"))  # Événements en attente max par client
+SSE_MAX_CLIENTS = int(os.environ.get("MSY_SSE_MAX_CLIENTS", "2000"))
+SSE_POLL_SECONDS = 0.25
+SSE_HEARTBEAT_SECONDS = 15
+
+def build_status():
+    # Compteur réel du moteur GENESY (None tant qu'il n'a rien publié)
+    metrics = GENESY_METRICS.read()
+    return {
+        "president": "IBK",
+        "msy_int": "OPÉRATIONNEL",
+        "vps": "157.173.119.36",
+        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "modules": metrics["modules_generated"] if metrics else None,
+        "status": "EN LIGNE"
+    }
+
+class CachedPayload:
+    """
+    Réponse JSON pré-sérialisée (corps, version gzip, ETag) rafraîchie en tâche de fond.
+
+    L'ETag ignore les champs `volatile` (horodatage) : il ne change que
+    si le contenu change, et If-None-Match peut répondre 304.
+    """
+
+    def __init__(self, builder, interval, volatile=("timestamp",)):
+        self.builder = builder
+        self.interval = interval
+        self.volatile = volatile
+        self.lock = threading.Lock()
+        self.refresh()
+
+    def refresh(self):
+        payload = self.builder()
+        body = json.dumps(payload).encode()
+        stable = json.dumps({k: v for k, v in payload.items() if k not in self.volatile}, sort_keys=True).encode()
+        entry = (body, gzip.compress(body, compresslevel=6), '"%s"' % hashlib.sha1(stable).hexdigest())
+        with self.lock:
+            self.entry = entry
+
+    def get(self):
+        with self.lock:
+            return self.entry
+
+    def start(self):
+        stop = threading.Event()
+
+        def loop():
+            while not stop.wait(self.interval):
+                self.refresh()
+
+        threading.Thread(target=loop, name="msy-status-refresh", daemon=True).start()
+        return stop
+
+class EventBroadcaster:
+    """
+    Diffusion des événements GENESY (anneau mmap) vers les abonnés SSE.
+
+    Chaque client a une file bornée : un client trop lent dont la file est
+    pleine est déconnecté (il se reconnecte avec Last-Event-ID et rejoue
+    les événements encore en mémoire) pour ne jamais bloquer les autres.
+    """
+
+    def __init__(self, reader, buffer_size, max_clients, poll_interval):
+        self.reader = reader
+        self.buffer_size = buffer_size
+        self.max_clients = max_clients
+        self.poll_interval = poll_interval
+        self.clients = set()
+        self.recent = deque(maxlen=buffer_size)
+        self.cursor = 0
+        self.dropped = 0
+        self.lock = threading.Lock()
+
+    def subscribe(self, last_id=None):
+        with self.lock:
+            if len(self.clients) >= self.max_clients:
+                return None
+
+            client = queue.Queue(maxsize=self.buffer_size)
+            if last_id is not None:
+                for event_id, frame in self.recent:
+                    if event_id > last_id:
+                        client.put_nowait(frame)
+
+            self.clients.add(client)
+            return client
+
+    def unsubscribe(self, client):
+        with self.lock:
+            self.clients.discard(client)
+
+    def drop(self, client):
+        # Vide la file puis signale la déconnexion (None)
+        self.clients.discard(client)
+        self.dropped += 1
+        try:
+            while True:
+                client.get_nowait()
+        except queue.Empty:
+            pass
+        client.put_nowait(None)
+
+    def poll(self):
+        # Moteur redémarré avec un anneau neuf
+        if self.reader.last() < self.cursor:
+            self.cursor = 0
+
+        for event in self.reader.read_since(self.cursor):
+            self.cursor = event["id"]
+            frame = ("id: %d\nevent: %s\ndata: %s\n\n" % (event["id"], event["event"], json.dumps(event))).encode()
+
+            with self.lock:
+                self.recent.append((event["id"], frame))
+                for client in list(self.clients):
+                    try:
+                        client.put_nowait(frame)
+                    except queue.Full:
+                        self.drop(client)
+
+    def start(self):
+        def loop():
+            while True:
+                self.poll()
+                time.sleep(self.poll_interval)
+
+        threading.Thread(target=loop, name="msy-sse-broadcast", daemon=True).start()
+
+GENESY_METRICS = MSYMetricsReader()
+STATUS = CachedPayload(build_status, STATUS_REFRESH_SECONDS)
+GENESY_AGGREGATES = MSYAggregatesReader()
+GENESY_EVENTS = EventBroadcaster(MSYEventReader(), SSE_CLIENT_BUFFER, SSE_MAX_CLIENTS, SSE_POLL_SECONDS)
 
 class MSYHandler(BaseHTTPRequestHandler):
-    def do_GET(self):
-        if self.path == '/api/status':
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
+    # Keep-alive HTTP/1.1 (Content-Length toujours envoyé)
+    protocol_version = "HTTP/1.1"
+    # En-têtes et corps envoyés séparément : pas d'attente Nagle/ACK retardé
+    disable_nagle_algorithm = True
+    # Client keep-alive inactif : connexion fermée, thread libéré
+    timeout = HANDLER_TIMEOUT_SECONDS
+
+    def send_cached(self, payload):
+        body, gzipped, etag = payload.get()
+
+        if etag in self.headers.get('If-None-Match', ''):
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
             self.end_headers()
-            status = {
-                "president": "IBK",
-                "msy_int": "OPÉRATIONNEL",
-                "vps": "157.173.119.36",
-                "timestamp": datetime.utcnow().isoformat() + "Z",
-                "modules": 2500,
-                "status": "EN LIGNE"
-            }
-            self.wfile.write(json.dumps(status).encode())
+            return
+
+        use_gzip = 'gzip' in self.headers.get('Accept-Encoding', '')
+        self.send_response(200)
+        self.send_header('Content-type', 'application/json')
+        self.send_header('ETag', etag)
+        self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('Cache-Control', 'no-cache')
+        if use_gzip:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(gzipped if use_gzip else body)))
+        self.end_headers()
+        self.wfile.write(gzipped if use_gzip else body)
+
+    def send_genesy(self):
+        # Lecture directe du mmap moteur (pas de JSON ni de disque côté lecture)
+        metrics = GENESY_METRICS.read()
+        body = json.dumps(metrics if metrics else {"status": "EN ATTENTE"}).encode()
+
+        self.send_response(200 if metrics else 503)
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Cache-Control', 'no-store')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_aggregates(self, query):
+        # Agrégats pré-calculés par le moteur (coût indépendant du nombre de modules)
+        aggregates = GENESY_AGGREGATES.read()
+        days = query.get('days', ['7'])[0]
+        days = min(int(days), 366) if days.isdigit() else 7
+        body = json.dumps(summarize_aggregates(aggregates, days) if aggregates else {"status": "EN ATTENTE"}).encode()
+
+        self.send_response(200 if aggregates else 503)
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_stream(self):
+        # Server-Sent Events : une connexion longue par client
+        last_id = self.headers.get('Last-Event-ID', '')
+        client = GENESY_EVENTS.subscribe(int(last_id) if last_id.isdigit() else None)
+
+        if client is None:
+            self.send_response(503)
+            self.send_header('Retry-After', '30')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        self.close_connection = True
+        self.send_response(200)
+        self.send_header('Content-type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'close')
+        self.send_header('X-Accel-Buffering', 'no')
+        self.end_headers()
+
+        try:
+            self.wfile.write(b"retry: 3000\n\n")
+            while True:
+                try:
+                    frame = client.get(timeout=SSE_HEARTBEAT_SECONDS)
+                except queue.Empty:
+                    frame = b": ping\n\n"
+                if frame is None:
+                    break  # Client trop lent : déconnecté
+                self.wfile.write(frame)
+        except (BrokenPipeError, ConnectionResetError, socket.timeout):
+            pass
+        finally:
+            GENESY_EVENTS.unsubscribe(client)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+
+        if url.path == '/api/status':
+            self.send_cached(STATUS)
+        elif url.path == '/api/genesy':
+            self.send_genesy()
+        elif url.path == '/api/genesy/stream':
+            self.send_stream()
+        elif url.path == '/api/genesy/aggregates':
+            self.send_aggregates(parse_qs(url.query))
         else:
             self.send_response(404)
+            self.send_header('Content-Length', '0')
             self.end_headers()
 
-import json
+    def log_message(self, format, *args):
+        # Log d'accès désactivé par défaut (coût à haut débit)
+        if os.environ.get("MSY_API_ACCESS_LOG"):
+            super().log_message(format, *args)
+
+class MSYServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
 if __name__ == '__main__':
-    server = HTTPServer(('0.0.0.0', 8000), MSYHandler)
+    STATUS.start()
+    GENESY_EVENTS.start()
+    server = MSYServer(('0.0.0.0', 8000), MSYHandler)
     print("MSY API V2 démarrée sur :8000")
     server.serve_forever()
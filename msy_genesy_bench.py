@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+MSY GENESY - BENCHMARK DES CHEMINS CRITIQUES
+================================================================================
+Mesure generate_module, mutate_genes, crossover_genes, calculate_fitness,
+evolve_generation et save_module (API MSYModule historique + population
+compacte, offspring en lot) sur des populations synthétiques de 50 à 1M modules, graines
+fixes, Triple Path sur tmpfs et sur disque.
+
+Sortie JSON (débit, RSS max, temps par étape) ; comparaison optionnelle
+avec une baseline pour détecter les régressions avant déploiement :
+
+    python msy_genesy_bench.py --save-baseline bench_baseline.json
+    python msy_genesy_bench.py --baseline bench_baseline.json
+================================================================================
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import platform
+import resource
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+
+DEFAULT_SIZES = [50, 1_000, 10_000, 100_000, 1_000_000]
+DEFAULT_SEED = 2025
+LEGACY_MAX = 100_000  # Au-delà, les étapes MSYModule (pur Python) sont ignorées
+SAVE_MAX = 1_000  # Modules sauvegardés par étape save_module
+TOLERANCE = 0.25  # Régression si débit < baseline * (1 - tolérance)
+
+def timed(stages: Dict, name: str, items: int, func):
+    """Exécute `func` et enregistre durée + débit de l'étape"""
+    start = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - start
+
+    stages[name] = {
+        "items": items,
+        "seconds": round(seconds, 6),
+        "per_second": round(items / seconds, 1) if seconds > 0 else None
+    }
+    return result
+
+def storage_roots(disk_dir: Optional[str]) -> Dict[str, Path]:
+    """Racines Triple Path : tmpfs (/dev/shm) et disque"""
+    roots = {"disk": Path(tempfile.mkdtemp(prefix="msy_bench_", dir=disk_dir))}
+
+    if Path("/dev/shm").is_dir():
+        roots["tmpfs"] = Path(tempfile.mkdtemp(prefix="msy_bench_", dir="/dev/shm"))
+
+    return roots
+
+def bench_size(size: int, seed: int, legacy_max: int, disk_dir: Optional[str]) -> Dict:
+    """Benchmark complet pour une taille de population (processus dédié : RSS isolé)"""
+    roots = storage_roots(disk_dir)
+    base = next(iter(roots.values()))
+
+    # Compteurs live / événements du moteur isolés du dashboard
+    os.environ["MSY_GENESY_METRICS"] = str(base / "metrics.bin")
+    os.environ["MSY_GENESY_EVENTS"] = str(base / "events.bin")
+
+    import msy_genesy_vps as genesy
+
+    stages: Dict[str, Dict] = {}
+
+    try:
+        engine = genesy.MSYGenesyEngine(
+            genesy_dir=base / "genesy",
+            triple_path={name: base / "triple" / name for name in "GDI"},
+            logs_dir=base / "logs"
+        )
+        params = engine.config['evolution_params']
+        params.update(seed=seed, generation_size=size)
+        random.seed(seed)
+        engine.rng = engine.evolver.rng = genesy.np.random.default_rng(seed)
+
+        # API MSYModule historique (pur Python)
+        if size <= legacy_max:
+            modules = timed(stages, "generate_module", size,
+                            lambda: [engine.generate_module(random.randint(1, 8)) for _ in range(size)])
+            timed(stages, "mutate_genes", size,
+                  lambda: [engine.mutate_genes(m.genes) for m in modules])
+            timed(stages, "crossover_genes", size,
+                  lambda: [engine.crossover_genes(m.genes, modules[i - 1].genes) for i, m in enumerate(modules)])
+            timed(stages, "calculate_fitness", size,
+                  lambda: [engine.calculate_fitness(m) for m in modules])
+            timed(stages, "calculate_fitness_population", size,
+                  lambda: engine.calculate_fitness_population(modules))
+            timed(stages, "evolve_generation", size,
+                  lambda: engine.evolve_generation(modules))
+            del modules
+
+        # Population compacte
+        population = timed(stages, "generate_population", size, lambda: engine.generate_population(size))
+        timed(stages, "fitness_batch", size, lambda: population.fitness())
+        parents = genesy.np.random.default_rng(seed).integers(size, size=(2, size))
+        timed(stages, "breed_offspring", size, lambda: engine.evolver.breed(population, parents[0], parents[1]))
+        population = timed(stages, "evolve_population", size, lambda: engine.evolve_population(population))
+
+        # Sauvegarde Triple Path (chaque backend, chaque support)
+        saved = min(size, SAVE_MAX)
+        to_save = engine.materialize_modules(population, range(saved))
+        engine.writer.close()
+
+        for medium, root in roots.items():
+            for backend in ("files", "segments"):
+                writer = genesy.MSYTriplePathWriter(
+                    {name: root / backend / name for name in "GDI"}, root / "logs", backend=backend
+                )
+                timed(stages, f"save_module[{medium},{backend}]", saved,
+                      lambda: [writer.write([module]) for module in to_save])
+                timed(stages, f"save_modules_batch[{medium},{backend}]", saved,
+                      lambda: writer.write(to_save))
+                writer.close()
+
+        engine.checkpointer.close()
+    finally:
+        for root in roots.values():
+            shutil.rmtree(root, ignore_errors=True)
+
+    return {
+        "size": size,
+        "rss_peak_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "stages": stages
+    }
+
+def compare(results: Dict, baseline: Dict, tolerance: float) -> List[Dict]:
+    """Étapes dont le débit a régressé par rapport à la baseline"""
+    reference = {
+        (entry["size"], name): stage["per_second"]
+        for entry in baseline["results"] for name, stage in entry["stages"].items()
+    }
+    regressions = []
+
+    for entry in results["results"]:
+        for name, stage in entry["stages"].items():
+            before = reference.get((entry["size"], name))
+            after = stage["per_second"]
+
+            if before and after is not None and after < before * (1 - tolerance):
+                regressions.append({
+                    "size": entry["size"],
+                    "stage": name,
+                    "baseline_per_second": before,
+                    "per_second": after,
+                    "change": round(after / before - 1, 4)
+                })
+
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark MSY GENESY")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Tailles de population")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--legacy-max", type=int, default=LEGACY_MAX, help="Taille max pour l'API MSYModule")
+    parser.add_argument("--disk-dir", default=None, help="Répertoire disque pour le Triple Path (défaut: tmp système)")
+    parser.add_argument("--output", help="Fichier JSON de résultats (défaut: stdout)")
+    parser.add_argument("--baseline", help="Baseline JSON à comparer")
+    parser.add_argument("--save-baseline", help="Enregistre les résultats comme baseline")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE)
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+    results = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "seed": args.seed
+        },
+        "results": []
+    }
+
+    for size in args.sizes:
+        print(f"🔬 Benchmark {size} modules...", file=sys.stderr)
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            results["results"].append(pool.submit(bench_size, size, args.seed, args.legacy_max, args.disk_dir).result())
+
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        results["regressions"] = regressions
+
+        for regression in regressions:
+            print(f"❌ Régression {regression['stage']} @ {regression['size']}: "
+                  f"{regression['per_second']}/s vs {regression['baseline_per_second']}/s "
+                  f"({regression['change']:+.1%})", file=sys.stderr)
+        exit_code = 1 if regressions else 0
+
+    payload = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(payload)
+    else:
+        print(payload)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            f.write(payload)
+
+    sys.exit(exit_code)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+MSY GENESY - SERVEUR GITHUB LOCAL (VÉRIFICATION DE LA SYNC)
+================================================================================
+Faux serveur API Git Data (bibliothèque standard, ThreadingHTTPServer)
+pour exercer MSYGitHubSync sans réseau ni token :
+
+  - commit nominal : ref -> commit parent -> arbre -> commit -> PATCH ref
+  - 429 + Retry-After : nouvel essai après l'attente demandée
+  - 422 sur PATCH (branche avancée entre-temps) : commit refait sur la
+    nouvelle tête, sans perdre le commit concurrent
+
+    python msy_genesy_github_mock.py
+
+Code de sortie 1 si un scénario échoue.
+================================================================================
+"""
+
+import sys
+import json
+import time
+import itertools
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+OWNER, REPO, BRANCH = "MONDIASYSTEM", "MSY-CORE", "main"
+
+class MockGitHub:
+    """
+    État d'un dépôt minimal : ref de branche, commits et arbres (chemin ->
+    contenu). `failures` : réponses imposées, consommées dans l'ordre, par
+    (méthode, suffixe de chemin) -> [(statut, en-têtes, action)].
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.ids = itertools.count(1)
+        self.trees: Dict[str, Dict[str, str]] = {"t0": {}}
+        self.commits: Dict[str, Dict] = {"c0": {"tree": "t0", "parents": [], "message": "initial"}}
+        self.ref = "c0"
+        self.calls: List[tuple] = []
+        self.failures: Dict[tuple, List[tuple]] = {}
+
+    def fail(self, method: str, suffix: str, status: int, headers: Optional[Dict] = None, action=None):
+        """Impose une réponse d'erreur au prochain appel correspondant"""
+        self.failures.setdefault((method, suffix), []).append((status, headers or {}, action))
+
+    def injected(self, method: str, path: str):
+        with self.lock:
+            for (fail_method, suffix), queued in self.failures.items():
+                if fail_method == method and path.endswith(suffix) and queued:
+                    return queued.pop(0)
+        return None
+
+    def new_commit(self, tree: str, parents: List[str], message: str) -> str:
+        sha = f"c{next(self.ids)}"
+        self.commits[sha] = {"tree": tree, "parents": parents, "message": message}
+        return sha
+
+    def push_concurrent(self, path: str = "concurrent.txt"):
+        """Commit d'un autre client sur la branche (fait avancer la ref)"""
+        with self.lock:
+            tree = f"t{next(self.ids)}"
+            self.trees[tree] = dict(self.trees[self.commits[self.ref]["tree"]], **{path: "autre client"})
+            self.ref = self.new_commit(tree, [self.ref], "commit concurrent")
+
+    def files(self) -> Dict[str, str]:
+        """Contenu de la tête de branche"""
+        return self.trees[self.commits[self.ref]["tree"]]
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    github: MockGitHub = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def reply(self, status: int, payload: Dict, headers: Optional[Dict] = None):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def handle_api(self, method: str):
+        github = self.github
+        length = int(self.headers.get('Content-Length', 0))
+        payload = json.loads(self.rfile.read(length) or b"{}") if length else {}
+        prefix = f"/repos/{OWNER}/{REPO}"
+        path = self.path[len(prefix):] if self.path.startswith(prefix) else None
+
+        with github.lock:
+            github.calls.append((method, path))
+
+        if path is None:
+            return self.reply(404, {"message": "Not Found"})
+
+        failure = github.injected(method, path)
+        if failure:
+            status, headers, action = failure
+            if action:
+                action()
+            return self.reply(status, {"message": "injected"}, headers)
+
+        with github.lock:
+            if method == "GET" and path == f"/git/ref/heads/{BRANCH}":
+                return self.reply(200, {"object": {"sha": github.ref}})
+
+            if method == "GET" and path.startswith("/git/commits/"):
+                commit = github.commits.get(path.rsplit('/', 1)[1])
+                if commit is None:
+                    return self.reply(404, {"message": "Not Found"})
+                return self.reply(200, {"tree": {"sha": commit["tree"]}, "parents": [{"sha": p} for p in commit["parents"]]})
+
+            if method == "POST" and path == "/git/trees":
+                files = dict(github.trees[payload["base_tree"]])
+                files.update({entry["path"]: entry["content"] for entry in payload["tree"]})
+                sha = f"t{next(github.ids)}"
+                github.trees[sha] = files
+                return self.reply(201, {"sha": sha})
+
+            if method == "POST" and path == "/git/commits":
+                return self.reply(201, {"sha": github.new_commit(payload["tree"], payload["parents"], payload["message"])})
+
+            if method == "PATCH" and path == f"/git/refs/heads/{BRANCH}":
+                # Pas de force : la tête doit être parente du nouveau commit (fast-forward)
+                if github.ref not in github.commits[payload["sha"]]["parents"] and not payload.get("force"):
+                    return self.reply(422, {"message": "Update is not a fast forward"})
+                github.ref = payload["sha"]
+                return self.reply(200, {"object": {"sha": github.ref}}, {"X-RateLimit-Remaining": "4999"})
+
+        self.reply(404, {"message": "Not Found"})
+
+    def do_GET(self):
+        self.handle_api("GET")
+
+    def do_POST(self):
+        self.handle_api("POST")
+
+    def do_PATCH(self):
+        self.handle_api("PATCH")
+
+def start_server(github: MockGitHub) -> ThreadingHTTPServer:
+    """Serveur sur un port libre de 127.0.0.1 (thread démon)"""
+    handler = type("BoundMockHandler", (MockHandler,), {"github": github})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, name="msy-github-mock", daemon=True).start()
+    return server
+
+def run_sync(github: MockGitHub, batches: List[Dict[str, str]]) -> Dict:
+    """Soumet les lots à un MSYGitHubSync pointé sur le serveur local, attend la fin"""
+    import msy_genesy_vps as genesy
+
+    server = start_server(github)
+    try:
+        sync = genesy.MSYGitHubSync(
+            "token-local", OWNER, REPO, BRANCH,
+            api_url=f"http://127.0.0.1:{server.server_address[1]}", max_retries=3, timeout=5
+        )
+        for i, files in enumerate(batches):
+            sync.submit(files, f"lot {i + 1}")
+        sync.close(timeout=30)
+        return sync.stats
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def scenario_commit() -> List[str]:
+    """Commit nominal : un lot -> un commit, fichiers sous le préfixe"""
+    github = MockGitHub()
+    stats = run_sync(github, [{"reports/cycle_1.json": "{}", "modules/level_1/MSY_GEN_A.json": "{}"}])
+    head = github.commits[github.ref]
+    methods = [method for method, _ in github.calls]
+
+    errors = []
+    if stats["commits"] != 1 or stats["failed"]:
+        errors.append(f"stats inattendues : {stats}")
+    if head["parents"] != ["c0"]:
+        errors.append(f"parent {head['parents']} au lieu de c0")
+    if set(github.files()) != {"genesy/reports/cycle_1.json", "genesy/modules/level_1/MSY_GEN_A.json"}:
+        errors.append(f"arbre inattendu : {sorted(github.files())}")
+    if methods != ["GET", "GET", "POST", "POST", "PATCH"]:
+        errors.append(f"séquence d'appels inattendue : {methods}")
+    return errors
+
+def scenario_retry_after() -> List[str]:
+    """429 + Retry-After sur la lecture de la ref : attente puis nouvel essai"""
+    github = MockGitHub()
+    github.fail("GET", f"/git/ref/heads/{BRANCH}", 429, {"Retry-After": "0.3"})
+    start = time.monotonic()
+    stats = run_sync(github, [{"reports/cycle_1.json": "{}"}])
+    elapsed = time.monotonic() - start
+
+    errors = []
+    if stats["commits"] != 1 or stats["retries"] != 1:
+        errors.append(f"stats inattendues : {stats}")
+    if elapsed < 0.3:
+        errors.append(f"Retry-After non respecté ({elapsed:.2f}s)")
+    if "genesy/reports/cycle_1.json" not in github.files():
+        errors.append("fichier absent de la branche")
+    return errors
+
+def scenario_fast_forward() -> List[str]:
+    """422 sur PATCH (branche avancée) : commit refait sur la nouvelle tête"""
+    github = MockGitHub()
+    github.fail("PATCH", f"/git/refs/heads/{BRANCH}", 422, action=github.push_concurrent)
+    stats = run_sync(github, [{"reports/cycle_1.json": "{}"}])
+    head = github.commits[github.ref]
+    patches = [path for method, path in github.calls if method == "PATCH"]
+
+    errors = []
+    if stats["commits"] != 1 or stats["failed"]:
+        errors.append(f"stats inattendues : {stats}")
+    if len(patches) != 2:
+        errors.append(f"{len(patches)} PATCH au lieu de 2")
+    if github.commits[head["parents"][0]]["message"] != "commit concurrent":
+        errors.append("nouveau commit non basé sur la tête concurrente")
+    if set(github.files()) != {"concurrent.txt", "genesy/reports/cycle_1.json"}:
+        errors.append(f"arbre inattendu : {sorted(github.files())}")
+    return errors
+
+SCENARIOS = {
+    "commit": scenario_commit,
+    "retry_after_429": scenario_retry_after,
+    "fast_forward_422": scenario_fast_forward,
+}
+
+def main():
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    failed = 0
+
+    for name, scenario in SCENARIOS.items():
+        errors = scenario()
+        failed += bool(errors)
+        print(f"{'❌' if errors else '✅'} {name}" + "".join(f"\n   - {error}" for error in errors))
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+MSY GENESY - STRUCTURES PARTAGÉES MOTEUR ↔ DASHBOARD
+================================================================================
+Fichiers à disposition fixe, mappés en mémoire, et agrégats JSON compacts,
+écrits par msy_genesy_vps.py et lus par msy_dashboard_v2_vps.py (même
+volume /app dans les deux conteneurs). Bibliothèque standard uniquement :
+le conteneur API n'installe aucune dépendance.
+================================================================================
+"""
+
+import os
+import json
+import errno
+import fcntl
+import mmap
+import time
+import struct
+import threading
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, Optional
+
+# Compteurs live GENESY
+METRICS_PATH = Path(os.environ.get("MSY_GENESY_METRICS", Path(__file__).resolve().parent / "msy_genesy_metrics.bin"))
+METRICS_MAGIC = b"MSYGM001"
+METRICS_FIELDS = (
+    "modules_generated",
+    "genes_mutated",
+    "evolution_cycles",
+    "cycle_latency_ms",
+    "best_fitness",
+    "updated_at"
+)
+# magic | seq (seqlock : impair = écriture en cours) | 3 compteurs | 3 flottants
+METRICS_LAYOUT = struct.Struct("<8sQQQQddd")
+METRICS_SEQ_OFFSET = 8
+METRICS_SEQ = struct.Struct("<Q")
+
+class MSYMetricsWriter:
+    """
+    Publication des compteurs GENESY dans un fichier mmap à disposition fixe.
+
+    Un seul écrivain (le moteur) ; les lecteurs ne prennent aucun verrou
+    grâce au compteur de séquence (seqlock).
+    """
+
+    def __init__(self, path: Path = METRICS_PATH):
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(self.path, 'a+b') as f:
+            if os.fstat(f.fileno()).st_size < METRICS_LAYOUT.size:
+                f.truncate(METRICS_LAYOUT.size)
+
+        self.file = open(self.path, 'r+b')
+        self.map = mmap.mmap(self.file.fileno(), METRICS_LAYOUT.size)
+        self.seq = METRICS_SEQ.unpack_from(self.map, METRICS_SEQ_OFFSET)[0] & ~1
+
+    def publish(self, modules_generated: int, genes_mutated: int, evolution_cycles: int,
+                cycle_latency_ms: float, best_fitness: float):
+        """Publie un instantané cohérent des compteurs"""
+        self.seq += 1
+        METRICS_SEQ.pack_into(self.map, METRICS_SEQ_OFFSET, self.seq)
+
+        METRICS_LAYOUT.pack_into(
+            self.map, 0, METRICS_MAGIC, self.seq,
+            modules_generated, genes_mutated, evolution_cycles,
+            cycle_latency_ms, best_fitness, time.time()
+        )
+
+        self.seq += 1
+        METRICS_SEQ.pack_into(self.map, METRICS_SEQ_OFFSET, self.seq)
+
+    def close(self):
+        self.map.close()
+        self.file.close()
+
+class MSYMetricsReader:
+    """Lecture sans verrou des compteurs GENESY (retente si écriture en cours)"""
+
+    def __init__(self, path: Path = METRICS_PATH, retries: int = 100):
+        self.path = path
+        self.retries = retries
+        self.map = None
+
+    def _open(self) -> bool:
+        try:
+            with open(self.path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size < METRICS_LAYOUT.size:
+                    return False
+                self.map = mmap.mmap(f.fileno(), METRICS_LAYOUT.size, access=mmap.ACCESS_READ)
+        except OSError:
+            return False
+        return True
+
+    def read(self) -> Optional[Dict]:
+        """Instantané des compteurs, ou None si le moteur n'a encore rien publié"""
+        if self.map is None and not self._open():
+            return None
+
+        for _ in range(self.retries):
+            before = METRICS_SEQ.unpack_from(self.map, METRICS_SEQ_OFFSET)[0]
+            if before & 1:
+                continue
+
+            magic, _, *values = METRICS_LAYOUT.unpack_from(self.map, 0)
+
+            if METRICS_SEQ.unpack_from(self.map, METRICS_SEQ_OFFSET)[0] == before:
+                if magic != METRICS_MAGIC:
+                    return None
+                return dict(zip(METRICS_FIELDS, values), seq=before)
+
+        return None
+
+# Événements d'évolution (anneau pour le flux SSE du dashboard)
+EVENTS_PATH = Path(os.environ.get("MSY_GENESY_EVENTS", Path(__file__).resolve().parent / "msy_genesy_events.bin"))
+EVENTS_MAGIC = b"MSYGE001"
+EVENTS_CAPACITY = 1024
+EVENT_KINDS = {1: "generation", 2: "cycle"}
+# magic | dernier numéro d'événement écrit | capacité
+EVENTS_HEADER = struct.Struct("<8sQI")
+# numéro (0 = écriture en cours) | type | horodatage | cycle | génération | best | mean | mutations | sauvegardés
+EVENT_SLOT = struct.Struct("<QIdQIddQI")
+EVENT_NUMBER = struct.Struct("<Q")
+
+class MSYEventWriter:
+    """
+    Publication des événements d'évolution dans un anneau mmap.
+
+    Chaque case porte son numéro d'événement, remis à 0 pendant l'écriture :
+    un lecteur qui voit le même numéro avant et après lecture a une case
+    cohérente, sans verrou.
+    """
+
+    def __init__(self, path: Path = EVENTS_PATH, capacity: int = EVENTS_CAPACITY):
+        self.path = path
+        self.capacity = capacity
+        size = EVENTS_HEADER.size + capacity * EVENT_SLOT.size
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(self.path, 'a+b') as f:
+            if os.fstat(f.fileno()).st_size != size:
+                f.truncate(0)
+                f.truncate(size)
+
+        self.file = open(self.path, 'r+b')
+        self.map = mmap.mmap(self.file.fileno(), size)
+
+        magic, last, stored_capacity = EVENTS_HEADER.unpack_from(self.map, 0)
+        self.last = last if magic == EVENTS_MAGIC and stored_capacity == capacity else 0
+        EVENTS_HEADER.pack_into(self.map, 0, EVENTS_MAGIC, self.last, capacity)
+
+    def publish(self, kind: str, cycle: int, generation: int, best_fitness: float,
+                mean_fitness: float, mutations: int, saved: int = 0) -> int:
+        """Ajoute un événement, retourne son numéro"""
+        number = self.last + 1
+        offset = EVENTS_HEADER.size + (number % self.capacity) * EVENT_SLOT.size
+        code = next(code for code, name in EVENT_KINDS.items() if name == kind)
+
+        EVENT_NUMBER.pack_into(self.map, offset, 0)
+        EVENT_SLOT.pack_into(self.map, offset, 0, code, time.time(), cycle, generation,
+                             best_fitness, mean_fitness, mutations, saved)
+        EVENT_NUMBER.pack_into(self.map, offset, number)
+
+        self.last = number
+        EVENTS_HEADER.pack_into(self.map, 0, EVENTS_MAGIC, number, self.capacity)
+        return number
+
+    def close(self):
+        self.map.close()
+        self.file.close()
+
+class MSYEventReader:
+    """Lecture sans verrou des événements d'évolution depuis l'anneau mmap"""
+
+    def __init__(self, path: Path = EVENTS_PATH):
+        self.path = path
+        self.map = None
+        self.capacity = 0
+
+    def _open(self) -> bool:
+        try:
+            with open(self.path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size < EVENTS_HEADER.size:
+                    return False
+                self.map = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+        except OSError:
+            return False
+
+        magic, _, self.capacity = EVENTS_HEADER.unpack_from(self.map, 0)
+        if magic != EVENTS_MAGIC or len(self.map) < EVENTS_HEADER.size + self.capacity * EVENT_SLOT.size:
+            self.map.close()
+            self.map = None
+            return False
+        return True
+
+    def last(self) -> int:
+        """Numéro du dernier événement publié (0 si aucun)"""
+        if self.map is None and not self._open():
+            return 0
+        return EVENTS_HEADER.unpack_from(self.map, 0)[1]
+
+    def read_since(self, after: int):
+        """Événements de numéro > `after` encore présents dans l'anneau (ordre croissant)"""
+        last = self.last()
+        events = []
+
+        for number in range(max(after + 1, last - self.capacity + 1, 1), last + 1):
+            offset = EVENTS_HEADER.size + (number % self.capacity) * EVENT_SLOT.size
+            values = EVENT_SLOT.unpack_from(self.map, offset)
+
+            # Case réécrite ou en cours d'écriture : ignorée
+            if values[0] != number or EVENT_NUMBER.unpack_from(self.map, offset)[0] != number:
+                continue
+
+            _, code, timestamp, cycle, generation, best, mean, mutations, saved = values
+            events.append({
+                "id": number,
+                "event": EVENT_KINDS.get(code, "unknown"),
+                "timestamp": timestamp,
+                "cycle": cycle,
+                "generation": generation,
+                "best_fitness": best,
+                "mean_fitness": mean,
+                "mutations": mutations,
+                "modules_saved": saved
+            })
+
+        return events
+
+# Agrégats des modules sauvegardés (comptes + histogrammes de fitness par jour)
+AGGREGATES_PATH = Path(os.environ.get("MSY_GENESY_AGGREGATES", Path(__file__).resolve().parent / "msy_genesy_aggregates.json"))
+AGGREGATES_VERSION = 1
+AGGREGATES_FITNESS_BINS = 10
+AGGREGATES_RETENTION_DAYS = 90
+
+def empty_aggregates(bins: int = AGGREGATES_FITNESS_BINS) -> Dict:
+    """Agrégats vides"""
+    return {"version": AGGREGATES_VERSION, "total": 0, "levels": {}, "status": {}, "genes": {},
+            "fitness_bins": bins, "days": {}, "updated_at": None}
+
+class MSYAggregates:
+    """
+    Agrégats incrémentaux des modules sauvegardés.
+
+    Comptes par niveau, statut et gène, et par jour de création un
+    histogramme de fitness (`bins` classes sur [0, 1]) + somme. Mis à jour
+    à chaque lot sauvegardé (O(taille du lot)), persistés en JSON compact
+    par remplacement atomique ; les jours au-delà de `retention_days` sont
+    oubliés pour garder une taille bornée.
+
+    Un seul processus écrivain : verrou exclusif (flock sur <path>.lock)
+    gardé jusqu'à close() ; BlockingIOError immédiat s'il est déjà tenu
+    (moteur en cours), sans quoi le moteur écraserait un fichier reconstruit.
+    """
+
+    def __init__(self, path: Path = AGGREGATES_PATH, bins: int = AGGREGATES_FITNESS_BINS,
+                 retention_days: int = AGGREGATES_RETENTION_DAYS):
+        self.path = path
+        self.retention_days = retention_days
+        self.lock = threading.Lock()
+        self.dirty = False
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock_file = open(path.with_name(path.name + ".lock"), 'a')
+        try:
+            fcntl.flock(self.lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            self.lock_file.close()
+            raise BlockingIOError(errno.EAGAIN, f"Agrégats {path} tenus par un autre processus (moteur en cours ?)") from None
+
+        self.data = load_aggregates(path)
+
+        if self.data is None or self.data["fitness_bins"] != bins:
+            self.data = empty_aggregates(bins)
+
+    def add(self, modules, fitness):
+        """Ajoute un lot de modules (attributs level, status, genes, created_at) et leur fitness"""
+        bins = self.data["fitness_bins"]
+
+        with self.lock:
+            for module, score in zip(modules, fitness):
+                level = str(module.level)
+                self.data["levels"][level] = self.data["levels"].get(level, 0) + 1
+                self.data["status"][module.status] = self.data["status"].get(module.status, 0) + 1
+                for gene in module.genes:
+                    self.data["genes"][gene] = self.data["genes"].get(gene, 0) + 1
+
+                day = self.data["days"].setdefault(module.created_at[:10], {"count": 0, "sum": 0.0, "hist": [0] * bins})
+                day["count"] += 1
+                day["sum"] += float(score)
+                day["hist"][min(bins - 1, max(0, int(score * bins)))] += 1
+
+                self.data["total"] += 1
+
+            self.dirty = True
+
+    def save(self) -> bool:
+        """Écriture atomique si modifié (retourne True si écrit)"""
+        with self.lock:
+            if not self.dirty:
+                return False
+
+            # Rétention : jours calendaires (clés ISO comparées à la date limite)
+            cutoff = cutoff_day(self.retention_days)
+            for day in [day for day in self.data["days"] if day < cutoff]:
+                del self.data["days"][day]
+
+            self.data["updated_at"] = time.time()
+            payload = json.dumps(self.data, separators=(",", ":"))
+            self.dirty = False
+
+        tmp_file = self.path.with_name(self.path.name + ".tmp")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, 'w') as f:
+            f.write(payload)
+        os.replace(tmp_file, self.path)
+        return True
+
+    def close(self):
+        """Libère le verrou écrivain"""
+        if self.lock_file:
+            self.lock_file.close()
+            self.lock_file = None
+
+def load_aggregates(path: Path) -> Optional[Dict]:
+    """Agrégats persistés, ou None si absents / illisibles / autre version"""
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    return data if isinstance(data, dict) and data.get("version") == AGGREGATES_VERSION else None
+
+def cutoff_day(days: int) -> str:
+    """Premier jour (ISO) des `days` derniers jours calendaires, aujourd'hui compris"""
+    return (date.today() - timedelta(days=days - 1)).isoformat()
+
+def summarize_aggregates(data: Dict, days: int = 7, top_genes: int = 10) -> Dict:
+    """Vue API : comptes, gènes les plus fréquents, distribution de fitness des `days` derniers jours calendaires"""
+    cutoff = cutoff_day(days)
+    recent = sorted(day for day in data["days"] if day >= cutoff) if days > 0 else []
+    hist = [0] * data["fitness_bins"]
+    count, total = 0, 0.0
+
+    for day in recent:
+        entry = data["days"][day]
+        count += entry["count"]
+        total += entry["sum"]
+        hist = [a + b for a, b in zip(hist, entry["hist"])]
+
+    return {
+        "total": data["total"],
+        "levels": data["levels"],
+        "status": data["status"],
+        "top_genes": sorted(data["genes"].items(), key=lambda item: (-item[1], item[0]))[:top_genes],
+        "fitness": {
+            "days": recent,
+            "count": count,
+            "mean": total / count if count else None,
+            "bins": data["fitness_bins"],
+            "histogram": hist
+        },
+        "updated_at": data["updated_at"]
+    }
+
+class MSYAggregatesReader:
+    """Lecture des agrégats, rechargés seulement si le fichier a changé (mtime)"""
+
+    def __init__(self, path: Path = AGGREGATES_PATH):
+        self.path = path
+        self.key = None
+        self.data = None
+        self.lock = threading.Lock()
+
+    def read(self) -> Optional[Dict]:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+
+        key = (stat.st_mtime_ns, stat.st_size)
+        with self.lock:
+            if key != self.key:
+                self.data = load_aggregates(self.path)
+                self.key = key
+            return self.data
@@ -24,28 +24,232 @@ CITATION INSPIRANTE :
 
 import os
 import sys
+import argparse
+import bisect
+import contextlib
+import copy
+import csv
+import fcntl
+import functools
 import json
+import multiprocessing
+import queue
 import random
+import signal
 import time
 import hashlib
+import io
+import sqlite3
+import threading
+import zipfile
+import zlib
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
-import requests
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
 from dataclasses import dataclass, asdict
 
+import numpy as np
+
+from msy_genesy_shared import MSYAggregates, MSYEventWriter, MSYMetricsWriter, empty_aggregates
+
 # Configuration MSY
 MSY_CONFIG_PATH = Path("/opt/msy_agents/MSY_SYNC/config/msy_config.env")
 MSY_GENESY_DIR = Path("/opt/msy_agents/MSY_GENESY")
 MSY_GENERATED_DIR = Path("/root/MSY_GENERATED_MODULES")
 MSY_LOGS_DIR = Path("/var/log/msy_genesy")
 
-# Triple Path MSY
-TRIPLE_PATH = {
-    "G": Path("/mnt/g/MSY_GENESY") if Path("/mnt/g").exists() else Path("/opt/msy_agents/MSY_GENESY"),
-    "D": Path("/mnt/d/MSY_GENESY") if Path("/mnt/d").exists() else Path("/root/MSY_BACKUPS/genesy"),
-    "I": Path("/mnt/i/MSY_GENESY") if Path("/mnt/i").exists() else Path("/opt/msy_agents/MSY_SYNC/genesy")
+# Triple Path MSY (montage, chemin monté, repli local)
+TRIPLE_PATH_CANDIDATES = {
+    "G": (Path("/mnt/g"), Path("/mnt/g/MSY_GENESY"), Path("/opt/msy_agents/MSY_GENESY")),
+    "D": (Path("/mnt/d"), Path("/mnt/d/MSY_GENESY"), Path("/root/MSY_BACKUPS/genesy")),
+    "I": (Path("/mnt/i"), Path("/mnt/i/MSY_GENESY"), Path("/opt/msy_agents/MSY_SYNC/genesy"))
+}
+
+@functools.lru_cache(maxsize=None)
+def resolve_triple_path() -> Dict[str, Path]:
+    """Résout le Triple Path à la première utilisation (sonder /mnt/* peut être lent)"""
+    return {
+        name: mounted if mount.exists() else fallback
+        for name, (mount, mounted, fallback) in TRIPLE_PATH_CANDIDATES.items()
+    }
+
+def __getattr__(name: str):
+    """TRIPLE_PATH reste accessible comme attribut du module (résolu paresseusement)"""
+    if name == "TRIPLE_PATH":
+        return resolve_triple_path()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+class MSYFileCache:
+    """
+    Fichiers de configuration parsés, en cache par (mtime_ns, taille).
+
+    Tant que le fichier ne change pas, `load` retourne le même objet sans
+    relire le disque (un seul stat).
+    """
+    
+    def __init__(self):
+        self.entries: Dict[Path, tuple] = {}
+        self.lock = threading.Lock()
+    
+    def load(self, path: Path, parser: Callable) -> Optional[Any]:
+        """Contenu parsé de `path`, ou None si le fichier n'existe pas"""
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            with self.lock:
+                self.entries.pop(path, None)
+            return None
+        
+        key = (stat.st_mtime_ns, stat.st_size)
+        
+        with self.lock:
+            entry = self.entries.get(path)
+            if entry and entry[0] == key:
+                return entry[1]
+        
+        with open(path, 'r') as f:
+            data = parser(f)
+        
+        with self.lock:
+            self.entries[path] = (key, data)
+        
+        return data
+    
+    def store(self, path: Path, data: Any):
+        """Associe `data` à l'état actuel de `path` (fichier que l'on vient d'écrire)"""
+        stat = path.stat()
+        with self.lock:
+            self.entries[path] = ((stat.st_mtime_ns, stat.st_size), data)
+
+CONFIG_CACHE = MSYFileCache()
+
+def parse_msy_env(f) -> Dict[str, str]:
+    """Parse un fichier KEY=VALUE (msy_config.env)"""
+    env = {}
+    
+    for line in f:
+        if '=' in line and not line.strip().startswith('#'):
+            key, value = line.strip().split('=', 1)
+            env[key] = value.strip('"').strip("'")
+    
+    return env
+
+# Fitness MSY
+STATUS_SCORES = {
+    "ACTIF": 1.0,
+    "SYNCHRONISÉ": 0.9,
+    "OPTIMISÉ": 0.95,
+    "EN_TEST": 0.7,
+    "DEPRECATED": 0.3
 }
+STATUS_CODES = {status: code for code, status in enumerate(STATUS_SCORES)}
+STATUS_NAMES = list(STATUS_SCORES) + ["INCONNU"]
+STATUS_UNKNOWN_CODE = len(STATUS_SCORES)  # Statut inconnu = 0.5
+STATUS_SCORE_TABLE = np.array(list(STATUS_SCORES.values()) + [0.5], dtype=np.float64)
+FRESHNESS_HOURS = 168  # 1 semaine max
+FRESHNESS_WEIGHT = 0.2
+FRESHNESS_TOLERANCE = 0.001  # Dérive du terme fraîcheur tolérée par le cache de fitness
+TOP_MODULES_PER_CYCLE = 10
+
+# Population compacte
+GENE_ID_DTYPE = np.uint16
+
+# Traits des gènes (MSYGene) par défaut
+GENE_DEFAULT_POWER = 0.5
+GENE_SAME_TYPE_COMPAT = 0.5
+
+def build_alias_table(weights: np.ndarray):
+    """
+    Table d'alias de Vose : tirage pondéré en O(1) (une case uniforme +
+    un test de probabilité). Poids tous nuls : tirage uniforme.
+    """
+    count = len(weights)
+    total = float(np.sum(weights))
+    scaled = np.asarray(weights, dtype=np.float64) * count / total if total > 0 else np.ones(count)
+    prob = np.ones(count)
+    alias = np.arange(count)
+
+    small = [i for i in range(count) if scaled[i] < 1.0]
+    large = [i for i in range(count) if scaled[i] >= 1.0]
+
+    while small and large:
+        low, high = small.pop(), large.pop()
+        prob[low] = scaled[low]
+        alias[low] = high
+        scaled[high] -= 1.0 - scaled[low]
+        (small if scaled[high] < 1.0 else large).append(high)
+
+    return prob, alias
+
+def splitmix64(values: np.ndarray) -> np.ndarray:
+    """Mélange SplitMix64 (uint64, vectorisé) : compteur -> bits pseudo-aléatoires"""
+    z = np.array(values, dtype=np.uint64, ndmin=1) + np.uint64(0x9E3779B97F4A7C15)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+def module_id_from_uid(uid: int, created_at: int) -> str:
+    """ID MSY_GEN_<date>_<hex> dérivé de l'uid compteur (sans MD5 ni random)"""
+    timestamp = datetime.fromtimestamp(int(created_at)).strftime('%Y%m%d_%H%M%S')
+    return f"MSY_GEN_{timestamp}_{int(splitmix64(uid)[0]) >> 32:08x}"
+
+def top_k(values: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices des k plus grandes valeurs, ordre décroissant (égalités :
+    plus petit indice d'abord). Sélection partielle (argpartition) puis tri
+    des k retenus : O(n + k log k) au lieu d'un tri complet.
+    """
+    k = min(max(int(k), 0), len(values))
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+
+    picked = np.argpartition(-values, k - 1)[:k] if k < len(values) else np.arange(len(values))
+    return picked[np.lexsort((picked, -values[picked]))]
+
+def encode_status(status: str) -> int:
+    """Encode un statut MSY en code entier (table STATUS_SCORE_TABLE)"""
+    return STATUS_CODES.get(status, STATUS_UNKNOWN_CODE)
+
+def calculate_fitness_batch(levels: np.ndarray, status_codes: np.ndarray,
+                            unique_genes: np.ndarray, gene_counts: np.ndarray,
+                            created_epochs: np.ndarray, now: Optional[Union[float, np.ndarray]] = None,
+                            synergy: Optional[np.ndarray] = None, synergy_weight: float = 0.0) -> np.ndarray:
+    """
+    Calcule la fitness d'une population entière en une passe vectorisée.
+
+    Même formule que MSYGenesyEngine.calculate_fitness :
+    diversité (0.3) + niveau (0.3) + fraîcheur (0.2) + statut (0.2).
+    `created_epochs` en secondes epoch (time.time()) ; `now` scalaire ou
+    tableau (une date par module). Avec `synergy` (MSYGeneTable.synergy),
+    le score y est mélangé à hauteur de `synergy_weight`.
+    """
+    if now is None:
+        now = time.time()
+
+    levels = np.asarray(levels, dtype=np.float64)
+    unique_genes = np.asarray(unique_genes, dtype=np.float64)
+    gene_counts = np.asarray(gene_counts, dtype=np.float64)
+    created_epochs = np.asarray(created_epochs, dtype=np.float64)
+
+    # Diversité génétique
+    score = (unique_genes / gene_counts) * 0.3
+
+    # Niveau hiérarchique
+    score += (levels / 8) * 0.3
+
+    # Âge (modules récents = plus adaptés)
+    age_hours = (now - created_epochs) / 3600
+    score += np.maximum(0, 1 - (age_hours / FRESHNESS_HOURS)) * FRESHNESS_WEIGHT
+
+    # Statut
+    score += STATUS_SCORE_TABLE[np.asarray(status_codes, dtype=np.intp)] * 0.2
+
+    # Synergie des gènes (power x compatibilité)
+    if synergy is not None and synergy_weight:
+        score = (1 - synergy_weight) * score + synergy_weight * synergy
+
+    return np.minimum(score, 1.0)
 
 @dataclass
 class MSYGene:
@@ -56,16 +260,1514 @@ class MSYGene:
     compatibility: List[str]
     mutations: int = 0
 
-@dataclass
-class MSYModule:
-    """Module MSY généré"""
-    id: str
-    name: str
-    level: int  # 1-8 (hiérarchie MSY)
-    genes: List[str]
-    status: str
-    created_at: str
-    hash: str
+@dataclass
+class MSYModule:
+    """Module MSY généré"""
+    id: str
+    name: str
+    level: int  # 1-8 (hiérarchie MSY)
+    genes: List[str]
+    status: str
+    created_at: str
+    hash: str
+
+class MSYGeneTable:
+    """
+    Table d'internement des gènes : nom <-> ID entier (uint16).
+
+    Construite depuis config['genes_pool'] ; les IDs suivent l'ordre
+    des types puis des gènes dans le pool. Les traits MSYGene (power,
+    compatibility, config['genes_traits']) sont précalculés en tableaux
+    denses : `power` (G), matrice `compat` (G x G) et tables d'alias de
+    mutation par gène voisin, pour un tirage pondéré en O(1).
+    """
+    
+    def __init__(self, genes_pool: Dict[str, List[str]], traits: Optional[Dict[str, Dict]] = None):
+        self.types: List[str] = list(genes_pool)
+        self.names: List[str] = []
+        self.ids: Dict[str, int] = {}
+        self.pools: List[np.ndarray] = []
+        self.gene_types: List[str] = []
+        self.traits = traits or {}
+        
+        for gene_type in self.types:
+            pool = [self.intern(name, gene_type) for name in genes_pool[gene_type]]
+            self.pools.append(np.array(pool, dtype=GENE_ID_DTYPE))
+        
+        self.build_traits()
+    
+    def build_traits(self):
+        """Précalcule power, matrice de compatibilité et tables d'alias"""
+        count = len(self.names)
+        self.genes = [
+            MSYGene(
+                name=name,
+                type=gene_type,
+                power=float(self.traits.get(name, {}).get('power', GENE_DEFAULT_POWER)),
+                compatibility=list(self.traits.get(name, {}).get('compatibility', []))
+            )
+            for name, gene_type in zip(self.names, self.gene_types)
+        ]
+        self.power = np.array([gene.power for gene in self.genes], dtype=np.float64)
+        
+        # Défaut : types différents complémentaires, même type partiel, doublon nul
+        types = np.array(self.gene_types, dtype=object)
+        self.compat = np.where(types[:, None] == types[None, :], GENE_SAME_TYPE_COMPAT, 1.0)
+        
+        # Compatibilités déclarées (symétriques)
+        for gene in self.genes:
+            for other in gene.compatibility:
+                if other in self.ids:
+                    self.compat[self.ids[gene.name], self.ids[other]] = 1.0
+                    self.compat[self.ids[other], self.ids[gene.name]] = 1.0
+        np.fill_diagonal(self.compat, 0.0)
+        
+        # Mutation : remplaçant pondéré par power x compatibilité avec le gène voisin
+        self.mutation_prob = np.empty((count, count))
+        self.mutation_alias = np.empty((count, count), dtype=np.intp)
+        for context in range(count):
+            self.mutation_prob[context], self.mutation_alias[context] = build_alias_table(
+                self.power * self.compat[context]
+            )
+    
+    def sample_mutation(self, context: int, rng: np.random.Generator) -> int:
+        """Gène de remplacement pondéré selon le gène voisin (méthode d'alias, O(1))"""
+        column = rng.integers(len(self.mutation_prob))
+        return column if rng.random() < self.mutation_prob[context, column] else self.mutation_alias[context, column]
+    
+    def sample_mutations(self, contexts: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """sample_mutation vectorisé : un remplaçant par gène de contexte"""
+        columns = rng.integers(len(self.mutation_prob), size=len(contexts))
+        keep = rng.random(len(contexts)) < self.mutation_prob[contexts, columns]
+        return np.where(keep, columns, self.mutation_alias[contexts, columns])
+    
+    def synergy(self, genes: np.ndarray, power: Optional[np.ndarray] = None,
+                compat: Optional[np.ndarray] = None) -> np.ndarray:
+        """Synergie par module : power moyen (0.5) + compatibilité moyenne des paires (0.5)"""
+        power = self.power if power is None else power
+        compat = self.compat if compat is None else compat
+        
+        width = genes.shape[1]
+        if width < 2:
+            mean_power = power[genes].mean(axis=1) if width else np.zeros(len(genes))
+            return 0.5 * mean_power + 0.5
+        
+        pairs = np.zeros(len(genes))
+        for i in range(width):
+            for j in range(i + 1, width):
+                pairs += compat[genes[:, i], genes[:, j]]
+        
+        return 0.5 * power[genes].mean(axis=1) + 0.5 * pairs / (width * (width - 1) / 2)
+    
+    def synergy_names(self, modules_genes: List[List[str]]) -> np.ndarray:
+        """
+        Synergie de modules donnés par noms de gènes (MSYModule.genes).
+        
+        Les gènes hors genes_pool (hiérarchie, gènes retirés par un
+        rechargement) ne sont pas internés : power / compatibilités de leurs
+        traits, sinon par défaut, dans des tableaux temporaires. La table et
+        l'alphabet de mutation ne changent jamais.
+        """
+        unknown = sorted({name for genes in modules_genes for name in genes if name not in self.ids})
+        ids = dict(self.ids, **{name: len(self.names) + i for i, name in enumerate(unknown)})
+        power, compat = self.power, self.compat
+        
+        if unknown:
+            power = np.concatenate([power, [float(self.traits.get(name, {}).get('power', GENE_DEFAULT_POWER)) for name in unknown]])
+            types = np.array(self.gene_types + [""] * len(unknown), dtype=object)
+            compat = np.where(types[:, None] == types[None, :], GENE_SAME_TYPE_COMPAT, 1.0)
+            compat[:len(self.names), :len(self.names)] = self.compat
+            
+            # Compatibilités déclarées impliquant un gène inconnu
+            for name, trait in self.traits.items():
+                for other in trait.get('compatibility', []):
+                    if name in ids and other in ids and (name in unknown or other in unknown):
+                        compat[ids[name], ids[other]] = compat[ids[other], ids[name]] = 1.0
+            np.fill_diagonal(compat, 0.0)
+        
+        # Modules de même largeur traités en une passe
+        result = np.empty(len(modules_genes))
+        widths: Dict[int, List[int]] = {}
+        for i, genes in enumerate(modules_genes):
+            widths.setdefault(len(genes), []).append(i)
+        
+        for width, rows in widths.items():
+            genes = np.array([[ids[name] for name in modules_genes[i]] for i in rows], dtype=np.intp).reshape(len(rows), width)
+            result[rows] = self.synergy(genes, power, compat)
+        
+        return result
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    def intern(self, name: str, gene_type: str = "") -> int:
+        """Retourne l'ID d'un gène (ajouté s'il est inconnu)"""
+        gene_id = self.ids.get(name)
+        if gene_id is None:
+            gene_id = len(self.names)
+            self.ids[name] = gene_id
+            self.names.append(name)
+            self.gene_types.append(gene_type)
+        return gene_id
+    
+    def encode(self, genes: List[str]) -> np.ndarray:
+        """Noms -> IDs (KeyError hors genes_pool : la table ne grandit pas)"""
+        return np.array([self.ids[name] for name in genes], dtype=GENE_ID_DTYPE)
+    
+    def decode(self, gene_ids) -> List[str]:
+        """IDs -> noms"""
+        return [self.names[gene_id] for gene_id in gene_ids]
+
+class MSYPopulation:
+    """
+    Population MSY compacte (struct-of-arrays).
+
+    Une ligne par module : IDs de gènes internés (MSYGeneTable), niveau
+    uint8, statut encodé uint8, création en secondes epoch int64 et uid
+    uint64 (compteur, l'ID texte n'est dérivé qu'à la sauvegarde).
+    Seuls les modules sauvegardés deviennent des MSYModule ; `scores`
+    garde la fitness calculée et `saved` marque les modules déjà persistés.
+    """
+    
+    __slots__ = ("genes", "levels", "status", "created_at", "uids", "scores", "saved", "scored_at")
+    
+    def __init__(self, genes: np.ndarray, levels: np.ndarray, status: np.ndarray, created_at: np.ndarray,
+                 uids: Optional[np.ndarray] = None, scores: Optional[np.ndarray] = None,
+                 saved: Optional[np.ndarray] = None, scored_at: Optional[float] = None):
+        self.genes = genes
+        self.levels = levels
+        self.status = status
+        self.created_at = created_at
+        self.uids = uids if uids is not None else np.zeros(len(levels), dtype=np.uint64)
+        
+        # Cache fitness (NaN = à calculer) + modules déjà sauvegardés
+        self.scores = scores if scores is not None else np.full(len(levels), np.nan)
+        self.saved = saved if saved is not None else np.zeros(len(levels), dtype=bool)
+        self.scored_at = scored_at
+    
+    @classmethod
+    def empty(cls, size: int, width: int) -> "MSYPopulation":
+        """Population vide pré-allouée"""
+        return cls(
+            genes=np.zeros((size, width), dtype=GENE_ID_DTYPE),
+            levels=np.zeros(size, dtype=np.uint8),
+            status=np.zeros(size, dtype=np.uint8),
+            created_at=np.zeros(size, dtype=np.int64)
+        )
+    
+    @classmethod
+    def from_modules(cls, modules: List[MSYModule], gene_table: MSYGeneTable) -> "MSYPopulation":
+        """Convertit une liste de MSYModule (même nombre de gènes)"""
+        width = len(modules[0].genes) if modules else len(gene_table.types)
+        population = cls.empty(len(modules), width)
+        
+        for i, module in enumerate(modules):
+            population.genes[i] = gene_table.encode(module.genes)
+            population.levels[i] = module.level
+            population.status[i] = encode_status(module.status)
+            population.created_at[i] = int(datetime.fromisoformat(module.created_at).timestamp())
+            population.uids[i] = int(module.hash, 16) if len(module.hash) == 16 else 0
+        
+        return population
+    
+    @classmethod
+    def concat(cls, parts: List["MSYPopulation"]) -> "MSYPopulation":
+        """Concatène plusieurs populations"""
+        scored_at = [p.scored_at for p in parts if p.scored_at is not None]
+        
+        return cls(
+            genes=np.concatenate([p.genes for p in parts]),
+            levels=np.concatenate([p.levels for p in parts]),
+            status=np.concatenate([p.status for p in parts]),
+            created_at=np.concatenate([p.created_at for p in parts]),
+            uids=np.concatenate([p.uids for p in parts]),
+            scores=np.concatenate([p.scores for p in parts]),
+            saved=np.concatenate([p.saved for p in parts]),
+            scored_at=min(scored_at) if scored_at else None
+        )
+    
+    def __len__(self) -> int:
+        return len(self.levels)
+    
+    @property
+    def width(self) -> int:
+        """Nombre de gènes par module"""
+        return self.genes.shape[1]
+    
+    @property
+    def nbytes(self) -> int:
+        """Mémoire occupée par les tableaux"""
+        return sum(getattr(self, name).nbytes for name in ("genes", "levels", "status", "created_at", "uids", "scores", "saved"))
+    
+    def take(self, indices) -> "MSYPopulation":
+        """Sous-population (copie)"""
+        return MSYPopulation(
+            genes=self.genes[indices],
+            levels=self.levels[indices],
+            status=self.status[indices],
+            created_at=self.created_at[indices],
+            uids=self.uids[indices],
+            scores=self.scores[indices],
+            saved=self.saved[indices],
+            scored_at=self.scored_at
+        )
+    
+    def unique(self) -> "MSYPopulation":
+        """Sans uid en double (première occurrence gardée ; uid 0 = inconnu, toujours gardé)"""
+        _, first = np.unique(self.uids, return_index=True)
+        keep = np.union1d(first, np.flatnonzero(self.uids == 0))
+        
+        return self if len(keep) == len(self) else self.take(keep)
+    
+    def unique_genes(self) -> np.ndarray:
+        """Nombre de gènes distincts par module"""
+        if self.width == 0:
+            return np.zeros(len(self), dtype=np.uint16)
+        ordered = np.sort(self.genes, axis=1)
+        return 1 + np.count_nonzero(ordered[:, 1:] != ordered[:, :-1], axis=1)
+    
+    def fitness(self, now: Optional[float] = None, gene_table: Optional['MSYGeneTable'] = None,
+                synergy_weight: float = 0.0) -> np.ndarray:
+        """Fitness de toute la population (calculate_fitness_batch)"""
+        synergy = gene_table.synergy(self.genes) if gene_table is not None and synergy_weight else None
+        
+        return calculate_fitness_batch(
+            self.levels, self.status, self.unique_genes(),
+            np.full(len(self), self.width), self.created_at, now,
+            synergy, synergy_weight
+        )
+    
+    def cached_fitness(self, now: Optional[float] = None, tolerance: float = FRESHNESS_TOLERANCE,
+                       gene_table: Optional['MSYGeneTable'] = None, synergy_weight: float = 0.0) -> np.ndarray:
+        """
+        Fitness avec cache par module.
+
+        Seuls les nouveaux modules (NaN) sont calculés, sauf si le terme de
+        fraîcheur a dérivé de plus de `tolerance` depuis le dernier calcul
+        complet : toute la population est alors recalculée.
+        """
+        if now is None:
+            now = time.time()
+        
+        drift = FRESHNESS_WEIGHT * (now - self.scored_at) / (FRESHNESS_HOURS * 3600) if self.scored_at is not None else None
+        
+        if drift is None or abs(drift) > tolerance:
+            self.scores = self.fitness(now, gene_table, synergy_weight)
+            self.scored_at = now
+        else:
+            stale = np.flatnonzero(np.isnan(self.scores))
+            if len(stale):
+                self.scores[stale] = self.take(stale).fitness(now, gene_table, synergy_weight)
+        
+        return self.scores
+
+class MSYStageTimer:
+    """Contexte de mesure d'une étape (perf_counter_ns)"""
+    
+    __slots__ = ("profiler", "name", "start")
+    
+    def __init__(self, profiler: "MSYProfiler", name: str):
+        self.profiler = profiler
+        self.name = name
+    
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+    
+    def __exit__(self, *exc):
+        self.profiler.observe(self.name, (time.perf_counter_ns() - self.start) / 1e9)
+        return False
+
+class MSYSamplingProfiler:
+    """
+    Profileur par échantillonnage (opt-in) : un thread relève toutes les
+    `interval` secondes la fonction en cours du thread ciblé.
+    """
+    
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.samples: Dict[str, int] = {}
+        self.stop_event = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+    
+    def start(self, thread_id: int):
+        self.samples = {}
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._run, args=(thread_id,), name="msy-sampler", daemon=True)
+        self.thread.start()
+    
+    def _run(self, thread_id: int):
+        while not self.stop_event.wait(self.interval):
+            frame = sys._current_frames().get(thread_id)
+            if frame is not None:
+                code = frame.f_code
+                key = f"{os.path.basename(code.co_filename)}:{code.co_name}:{code.co_firstlineno}"
+                self.samples[key] = self.samples.get(key, 0) + 1
+    
+    def stop(self, top: int) -> List[tuple]:
+        """Arrête l'échantillonnage, retourne les `top` fonctions (nom, échantillons)"""
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+        return sorted(self.samples.items(), key=lambda item: item[1], reverse=True)[:top]
+
+class MSYProfiler:
+    """
+    Instrumentation du cycle : chronos monotones par étape, histogrammes de
+    latence et export Prometheus (format texte).
+
+    Désactivé, `stage()` retourne un contexte no-op partagé : aucun appel
+    d'horloge ni allocation dans les boucles instrumentées.
+    """
+    
+    BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+    NULL_STAGE = contextlib.nullcontext()
+    
+    def __init__(self, enabled: bool = False, sampling: bool = False, sample_interval_ms: float = 5,
+                 top_functions: int = 15, prometheus_file: Optional[Path] = None):
+        self.enabled = enabled
+        self.sampler = MSYSamplingProfiler(sample_interval_ms / 1000) if enabled and sampling else None
+        self.top_functions = top_functions
+        self.prometheus_file = prometheus_file
+        self.histograms: Dict[str, List] = {}  # étape -> [compteurs par bucket, somme, total, dernière]
+        self.last_top: List[tuple] = []
+        self.lock = threading.Lock()
+    
+    def stage(self, name: str):
+        """Contexte de mesure d'une étape (no-op si désactivé)"""
+        return MSYStageTimer(self, name) if self.enabled else self.NULL_STAGE
+    
+    def observe(self, name: str, seconds: float):
+        """Ajoute une durée à l'histogramme de l'étape"""
+        with self.lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = [[0] * len(self.BUCKETS), 0.0, 0, 0.0]
+            
+            bucket = bisect.bisect_left(self.BUCKETS, seconds)
+            if bucket < len(self.BUCKETS):
+                histogram[0][bucket] += 1
+            histogram[1] += seconds
+            histogram[2] += 1
+            histogram[3] = seconds
+    
+    def start_cycle(self):
+        """Démarre l'échantillonnage du thread courant (mode profileur)"""
+        if self.sampler:
+            self.sampler.start(threading.get_ident())
+    
+    def end_cycle(self) -> List[tuple]:
+        """Arrête l'échantillonnage, retourne les fonctions les plus échantillonnées"""
+        if self.sampler:
+            self.last_top = self.sampler.stop(self.top_functions)
+        return self.last_top
+    
+    def last_durations(self) -> Dict[str, float]:
+        """Dernière durée mesurée par étape (secondes)"""
+        with self.lock:
+            return {name: histogram[3] for name, histogram in self.histograms.items()}
+    
+    def render_prometheus(self, stats: Optional[Dict] = None) -> str:
+        """Histogrammes (+ compteurs stats) au format texte Prometheus"""
+        lines = [
+            "# HELP msy_genesy_stage_seconds Durée des étapes du cycle GENESY",
+            "# TYPE msy_genesy_stage_seconds histogram"
+        ]
+        
+        with self.lock:
+            for name, (counts, total_seconds, count, _) in sorted(self.histograms.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(self.BUCKETS, counts):
+                    cumulative += bucket_count
+                    lines.append(f'msy_genesy_stage_seconds_bucket{{stage="{name}",le="{bound}"}} {cumulative}')
+                lines.append(f'msy_genesy_stage_seconds_bucket{{stage="{name}",le="+Inf"}} {count}')
+                lines.append(f'msy_genesy_stage_seconds_sum{{stage="{name}"}} {total_seconds:.9f}')
+                lines.append(f'msy_genesy_stage_seconds_count{{stage="{name}"}} {count}')
+        
+        if self.last_top:
+            lines.append("# HELP msy_genesy_profile_samples Échantillons par fonction (dernier cycle)")
+            lines.append("# TYPE msy_genesy_profile_samples gauge")
+            for function, samples in self.last_top:
+                escaped = function.replace('\\', '\\\\').replace('"', '\\"')
+                lines.append(f'msy_genesy_profile_samples{{function="{escaped}"}} {samples}')
+        
+        for key in ("modules_generated", "genes_mutated", "evolution_cycles", "evolution_generations"):
+            if stats and key in stats:
+                lines.append(f"# TYPE msy_genesy_{key}_total counter")
+                lines.append(f"msy_genesy_{key}_total {stats[key]}")
+        
+        return "\n".join(lines) + "\n"
+    
+    def write_prometheus(self, stats: Optional[Dict] = None):
+        """Export textfile Prometheus (écriture atomique)"""
+        if not self.prometheus_file:
+            return
+        
+        tmp_file = self.prometheus_file.with_name(self.prometheus_file.name + ".tmp")
+        try:
+            self.prometheus_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, 'w') as f:
+                f.write(self.render_prometheus(stats))
+            os.replace(tmp_file, self.prometheus_file)
+        except OSError as e:
+            print(f"⚠️  Export Prometheus échoué: {e}")
+
+DISABLED_PROFILER = MSYProfiler()
+
+def is_number(value) -> bool:
+    """Nombre JSON (int ou float, pas bool)"""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+# Stratégies de sélection (evolution_params)
+SELECTION_STRATEGIES = ("truncation", "tournament", "rank")
+PARENT_SELECTIONS = ("fitness", "uniform")
+
+class MSYEvolver:
+    """
+    Opérateurs génétiques sur population compacte.
+
+    Sans E/S ni stats globales : utilisable par le moteur comme par les
+    processus îles (run_islands). `mutations` compte les mutations appliquées.
+    `now` fige l'horloge (création + fraîcheur) pour des runs reproductibles.
+    Les offspring sont produits par lots (breed) : parents, points de
+    crossover et masques de mutation tirés en tableaux.
+    """
+    
+    def __init__(self, params: Dict, gene_table: MSYGeneTable, rng: np.random.Generator,
+                 now: Optional[int] = None, profiler: MSYProfiler = DISABLED_PROFILER):
+        self.params = params
+        self.gene_table = gene_table
+        self.rng = rng
+        self.now = now
+        self.profiler = profiler
+        self.mutations = 0
+        self.uid_key: Optional[int] = None
+        self.uid_counter = 0
+    
+    def timestamp(self) -> int:
+        """Horloge de création (figée si `now` est défini)"""
+        return self.now if self.now is not None else int(time.time())
+    
+    def generate_population(self, size: int) -> MSYPopulation:
+        """Génère une population initiale compacte"""
+        population = MSYPopulation.empty(size, len(self.gene_table.pools))
+        
+        # Nouveau module : un gène de chaque type
+        for column, pool in enumerate(self.gene_table.pools):
+            population.genes[:, column] = pool[self.rng.integers(len(pool), size=size)]
+        
+        population.levels[:] = self.rng.integers(1, 9, size=size)
+        population.status[:] = STATUS_CODES["ACTIF"]
+        population.created_at[:] = self.timestamp()
+        population.uids[:] = self.next_uids(size)
+        
+        return population
+    
+    def next_uids(self, count: int) -> np.ndarray:
+        """
+        UIDs des nouveaux modules : clé aléatoire (tirée au premier usage,
+        après une éventuelle restauration du générateur) + compteur.
+        """
+        if self.uid_key is None:
+            self.uid_key = int(self.rng.integers(2 ** 63))
+        
+        uids = np.arange(self.uid_counter, self.uid_counter + count, dtype=np.uint64) + np.uint64(self.uid_key)
+        self.uid_counter += count
+        return uids
+    
+    def score(self, population: MSYPopulation) -> np.ndarray:
+        """Fitness (cache) avec synergie des gènes"""
+        return population.cached_fitness(
+            self.now, self.params.get('freshness_tolerance', FRESHNESS_TOLERANCE),
+            self.gene_table, self.params.get('gene_synergy_weight', 0.0)
+        )
+    
+    def mutate_gene_ids(self, genes: np.ndarray) -> np.ndarray:
+        """Mutation génétique (IDs internés, en place)"""
+        if self.rng.random() < self.params['mutation_rate']:
+            # Remplacer un gène aléatoire : tirage pondéré power x compatibilité avec son voisin
+            if len(genes):
+                position = self.rng.integers(len(genes))
+                context = genes[(position + 1) % len(genes)]
+                genes[position] = self.gene_table.sample_mutation(context, self.rng)
+            
+            self.mutations += 1
+        
+        return genes
+    
+    def mutate_batch(self, genes: np.ndarray):
+        """Mutation d'un lot (en place) : une passe de mutate_gene_ids sur chaque ligne"""
+        count, width = genes.shape
+        mutated = np.flatnonzero(self.rng.random(count) < self.params['mutation_rate'])
+        self.mutations += len(mutated)
+        
+        if width and len(mutated):
+            positions = self.rng.integers(width, size=len(mutated))
+            contexts = genes[mutated, (positions + 1) % width]
+            genes[mutated, positions] = self.gene_table.sample_mutations(contexts, self.rng)
+    
+    def breed(self, population: MSYPopulation, parents1: np.ndarray, parents2: np.ndarray) -> MSYPopulation:
+        """
+        Offspring en lot : crossover à un point puis double mutation
+        (comme crossover_gene_ids + 2 x mutate_gene_ids), niveau d'un parent
+        au hasard.
+        """
+        count, width = len(parents1), population.width
+        offspring = MSYPopulation.empty(count, width)
+        offspring.genes[:] = population.genes[parents1]
+        
+        # Crossover : colonnes >= point prises du parent 2
+        if width > 1:
+            crossed = self.rng.random(count) < self.params['crossover_rate']
+            points = self.rng.integers(1, width, size=count)
+            mask = crossed[:, None] & (np.arange(width)[None, :] >= points[:, None])
+            np.copyto(offspring.genes, population.genes[parents2], where=mask)
+        
+        # Mutation + mutation à la création (comme generate_module)
+        self.mutate_batch(offspring.genes)
+        self.mutate_batch(offspring.genes)
+        
+        offspring.levels[:] = np.where(self.rng.random(count) < 0.5, population.levels[parents1], population.levels[parents2])
+        offspring.status[:] = STATUS_CODES["ACTIF"]
+        offspring.created_at[:] = self.timestamp()
+        offspring.uids[:] = self.next_uids(count)
+        
+        return offspring
+    
+    def crossover_gene_ids(self, parent1: np.ndarray, parent2: np.ndarray) -> np.ndarray:
+        """Crossover génétique (IDs internés)"""
+        child = parent1.copy()
+        
+        if self.rng.random() < self.params['crossover_rate']:
+            # Point de crossover aléatoire
+            point = self.rng.integers(1, len(parent1))
+            child[point:] = parent2[point:]
+        
+        return child
+    
+    def select_survivors(self, fitness: np.ndarray, count: int) -> np.ndarray:
+        """
+        Survivants selon params['selection'] :
+        - "truncation" : les `count` meilleurs (top_k, O(n))
+        - "tournament" : `count` tournois de `tournament_size` modules tirés
+          au hasard, le meilleur gagne (gagnants dédupliqués)
+        - "rank" : roulette pondérée par le rang, sans remise (clés
+          Efraimidis-Spirakis log(u) / rang puis top_k)
+        """
+        strategy = self.params.get('selection', 'truncation')
+        
+        if strategy == 'truncation' or count >= len(fitness):
+            return top_k(fitness, count)
+        
+        if strategy == 'tournament':
+            contestants = self.rng.integers(len(fitness), size=(count, self.params.get('tournament_size', 3)))
+            winners = contestants[np.arange(count), np.argmax(fitness[contestants], axis=1)]
+            return np.unique(winners)
+        
+        if strategy == 'rank':
+            ranks = np.empty(len(fitness))
+            ranks[np.argsort(fitness, kind='stable')] = np.arange(1, len(fitness) + 1)
+            return top_k(np.log(self.rng.random(len(fitness))) / ranks, count)
+        
+        raise ValueError(f"Stratégie de sélection inconnue: {strategy}")
+    
+    def select_parents(self, candidates: np.ndarray, fitness: np.ndarray, count: int) -> np.ndarray:
+        """
+        Tire `count` parents parmi `candidates` : proportionnel à la fitness
+        (somme cumulée + recherche dichotomique) ou uniforme selon
+        params['parent_selection'].
+        """
+        if self.params.get('parent_selection', 'fitness') == 'fitness':
+            cumulative = np.cumsum(fitness)
+            if len(cumulative) and cumulative[-1] > 0:
+                picks = np.searchsorted(cumulative, self.rng.random(count) * cumulative[-1], side='right')
+                return candidates[np.minimum(picks, len(candidates) - 1)]
+        
+        return candidates[self.rng.integers(len(candidates), size=count)]
+    
+    def evolve_population(self, population: MSYPopulation) -> MSYPopulation:
+        """Évolution d'une génération (population compacte)"""
+        # Calculer fitness (cache)
+        with self.profiler.stage("score"):
+            fitness = self.score(population)
+        
+        # Sélection (stratégie configurable, meilleurs survivent par défaut)
+        with self.profiler.stage("select"):
+            survivors = self.select_survivors(fitness, int(len(population) * self.params['selection_pressure']))
+        
+        # Compléter avec offspring (2 parents chacun, tirés en un seul lot)
+        count = max(0, self.params['generation_size'] - len(survivors))
+        parents = self.select_parents(survivors, fitness[survivors], 2 * count)
+        
+        with self.profiler.stage("breed"):
+            offspring = self.breed(population, parents[0::2], parents[1::2])
+        
+        return MSYPopulation.concat([population.take(survivors), offspring])
+
+def evolve_island(params: Dict, gene_table: MSYGeneTable, population: MSYPopulation,
+                  rng: np.random.Generator, generations: int, now: int):
+    """
+    Fait évoluer une île pendant `generations` générations (processus worker).
+
+    Retourne (population, rng, mutations) : le générateur revient avec son
+    état avancé pour que l'époque suivante reste reproductible.
+    """
+    evolver = MSYEvolver(params, gene_table, rng, now)
+    
+    for _ in range(generations):
+        population = evolver.evolve_population(population)
+    
+    return population, evolver.rng, evolver.mutations
+
+def island_mp_context():
+    """
+    Contexte des processus îles : forkserver (spawn à défaut), jamais fork
+    depuis le moteur dont les threads (écriture, persistance, GitHub) tournent.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+def migrate_elites(populations: List[MSYPopulation], migrants: int, now: Optional[float] = None,
+                   gene_table: Optional[MSYGeneTable] = None, synergy_weight: float = 0.0,
+                   tolerance: float = FRESHNESS_TOLERANCE) -> List[MSYPopulation]:
+    """
+    Migration en anneau : les `migrants` meilleurs modules de l'île i
+    remplacent les moins bons de l'île i+1. Les élites sont copiées (elles
+    restent dans leur île) : dédupliquer par uid à la fusion (MSYPopulation.unique).
+    """
+    if len(populations) < 2 or migrants <= 0:
+        return populations
+    
+    scores = [p.cached_fitness(now, tolerance, gene_table, synergy_weight) for p in populations]
+    elites = [p.take(top_k(fitness, migrants)) for p, fitness in zip(populations, scores)]
+    
+    migrated = []
+    for i, (population, fitness) in enumerate(zip(populations, scores)):
+        incoming = elites[i - 1]
+        keep = np.sort(top_k(fitness, len(population) - len(incoming)))
+        migrated.append(MSYPopulation.concat([population.take(keep), incoming]))
+    
+    return migrated
+
+class MSYModuleStore:
+    """
+    Stockage des modules en segments append-only (JSON Lines).
+
+    Les modules sont ajoutés en fin du segment actif (rotation à
+    `segment_max_bytes`) ; un index SQLite sur disque donne pour chaque id
+    son segment/offset et indexe niveau, gènes et created_at pour les
+    requêtes par plage. Un id réécrit pointe vers sa dernière version ;
+    `compact` réécrit les segments sans les versions obsolètes.
+    `read_only` : lecture seule d'un store existant (rien n'est créé,
+    FileNotFoundError sans index).
+    
+    Un seul processus écrivain : verrou exclusif (flock sur store.lock)
+    pris à l'ouverture et gardé jusqu'à close(). `blocking=False` échoue
+    aussitôt (RuntimeError) si un autre processus tient le store.
+    """
+    
+    SEGMENT_PATTERN = "segment_{:06d}.jsonl"
+    
+    def __init__(self, root: Path, segment_max_bytes: int = 64 * 1024 * 1024, read_only: bool = False,
+                 blocking: bool = True):
+        self.root = root
+        self.segments_dir = root / "segments"
+        self.segment_max_bytes = segment_max_bytes
+        self.lock = threading.RLock()
+        self.handle = None
+        self.lock_file = None
+        
+        if read_only:
+            index = root / "index.sqlite3"
+            if not index.exists():
+                raise FileNotFoundError(f"Index du store absent : {index}")
+            self.db = sqlite3.connect(index.resolve().as_uri() + "?mode=ro", uri=True, check_same_thread=False)
+            self.active_segment = None
+            return
+        
+        self.segments_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Verrou écrivain (moteur et commandes CLI ne partagent jamais un store)
+        self.lock_file = open(root / "store.lock", 'a')
+        try:
+            fcntl.flock(self.lock_file, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        except BlockingIOError:
+            self.lock_file.close()
+            raise RuntimeError(f"Store {root} utilisé par un autre processus (moteur en cours ?)") from None
+        
+        self.db = sqlite3.connect(str(root / "index.sqlite3"), check_same_thread=False)
+        self.db.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            CREATE TABLE IF NOT EXISTS modules (
+                id TEXT PRIMARY KEY,
+                segment INTEGER NOT NULL,
+                offset INTEGER NOT NULL,
+                length INTEGER NOT NULL,
+                level INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                created_at TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS modules_level ON modules (level, created_at);
+            CREATE INDEX IF NOT EXISTS modules_created_at ON modules (created_at);
+            CREATE TABLE IF NOT EXISTS module_genes (
+                gene TEXT NOT NULL,
+                id TEXT NOT NULL,
+                PRIMARY KEY (gene, id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS module_genes_id ON module_genes (id);
+        """)
+        
+        segments = self.segment_numbers()
+        self.active_segment = segments[-1] if segments else 1
+    
+    def segment_numbers(self) -> List[int]:
+        """Numéros des segments présents (triés)"""
+        return sorted(int(p.stem.split('_')[1]) for p in self.segments_dir.glob("segment_*.jsonl"))
+    
+    def segment_path(self, segment: int) -> Path:
+        return self.segments_dir / self.SEGMENT_PATTERN.format(segment)
+    
+    def _open_active(self):
+        """Handle d'ajout sur le segment actif (rotation si plein)"""
+        if self.handle is None:
+            self.handle = open(self.segment_path(self.active_segment), 'ab')
+        
+        if self.handle.tell() >= self.segment_max_bytes:
+            self.handle.close()
+            self.active_segment += 1
+            self.handle = open(self.segment_path(self.active_segment), 'ab')
+        
+        return self.handle
+    
+    def append(self, modules: List[MSYModule]) -> int:
+        """Ajoute un lot de modules (un seul commit d'index)"""
+        if not modules:
+            return 0
+        
+        with self.lock:
+            rows = []
+            genes = []
+            
+            for module in modules:
+                handle = self._open_active()
+                record = json.dumps(asdict(module), ensure_ascii=False).encode() + b"\n"
+                offset = handle.tell()
+                handle.write(record)
+                
+                rows.append((module.id, self.active_segment, offset, len(record), module.level, module.status, module.created_at))
+                genes.extend((gene, module.id) for gene in set(module.genes))
+            
+            self.handle.flush()
+            
+            with self.db:
+                self.db.executemany("DELETE FROM module_genes WHERE id = ?", [(row[0],) for row in rows])
+                self.db.executemany("INSERT OR REPLACE INTO modules VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+                self.db.executemany("INSERT OR IGNORE INTO module_genes VALUES (?, ?)", genes)
+            
+            return len(rows)
+    
+    def _read(self, segment: int, offset: int, length: int) -> MSYModule:
+        """Lit un enregistrement à son offset"""
+        with open(self.segment_path(segment), 'rb') as f:
+            f.seek(offset)
+            return MSYModule(**json.loads(f.read(length)))
+    
+    def get(self, module_id: str) -> Optional[MSYModule]:
+        """Module par id (une lecture d'index + un seek)"""
+        with self.lock:
+            row = self.db.execute("SELECT segment, offset, length FROM modules WHERE id = ?", (module_id,)).fetchone()
+        
+        return self._read(*row) if row else None
+    
+    def _where(self, level: Optional[int], gene: Optional[str], since: Optional[str], until: Optional[str],
+               status: Optional[str] = None):
+        """Clause WHERE des requêtes"""
+        clauses, params = [], []
+        
+        if level is not None:
+            clauses.append("m.level = ?")
+            params.append(level)
+        if status is not None:
+            clauses.append("m.status = ?")
+            params.append(status)
+        if gene is not None:
+            clauses.append("m.id IN (SELECT id FROM module_genes WHERE gene = ?)")
+            params.append(gene)
+        if since is not None:
+            clauses.append("m.created_at >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("m.created_at < ?")
+            params.append(until)
+        
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+    
+    def count(self, level: Optional[int] = None, gene: Optional[str] = None,
+              since: Optional[str] = None, until: Optional[str] = None, status: Optional[str] = None) -> int:
+        """Nombre de modules (filtres optionnels)"""
+        where, params = self._where(level, gene, since, until, status)
+        
+        with self.lock:
+            return self.db.execute(f"SELECT COUNT(*) FROM modules m{where}", params).fetchone()[0]
+    
+    def query(self, level: Optional[int] = None, gene: Optional[str] = None,
+              since: Optional[str] = None, until: Optional[str] = None,
+              limit: Optional[int] = None, status: Optional[str] = None) -> Iterator[MSYModule]:
+        """
+        Modules filtrés par niveau, gène, statut et plage created_at
+        [since, until), triés par created_at. Lecture en flux : curseur d'une
+        connexion de lecture dédiée (WAL, n'attend pas les écritures) et
+        mémoire constante quel que soit le nombre de modules.
+        """
+        for record in self.records(level, gene, since, until, limit, status):
+            yield MSYModule(**json.loads(record))
+    
+    def records(self, level: Optional[int] = None, gene: Optional[str] = None,
+                since: Optional[str] = None, until: Optional[str] = None,
+                limit: Optional[int] = None, status: Optional[str] = None) -> Iterator[bytes]:
+        """Comme query, mais enregistrements JSON bruts (ligne complète, sans décodage)"""
+        where, params = self._where(level, gene, since, until, status)
+        sql = f"SELECT segment, offset, length FROM modules m{where} ORDER BY m.created_at"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        
+        reader = sqlite3.connect((self.root / "index.sqlite3").resolve().as_uri() + "?mode=ro", uri=True)
+        handles = {}
+        try:
+            for segment, offset, length in reader.execute(sql, params):
+                if segment not in handles:
+                    handles[segment] = open(self.segment_path(segment), 'rb')
+                handles[segment].seek(offset)
+                yield handles[segment].read(length)
+        finally:
+            for handle in handles.values():
+                handle.close()
+            reader.close()
+    
+    def compact(self) -> Dict[str, int]:
+        """
+        Réécrit les versions vivantes dans de nouveaux segments puis supprime
+        les anciens (index basculé en une transaction avant suppression).
+        """
+        with self.lock:
+            old_segments = self.segment_numbers()
+            if self.handle:
+                self.handle.close()
+                self.handle = None
+            
+            before = sum(self.segment_path(n).stat().st_size for n in old_segments)
+            self.active_segment = (old_segments[-1] if old_segments else 0) + 1
+            
+            rows = self.db.execute("SELECT id, segment, offset, length FROM modules ORDER BY segment, offset").fetchall()
+            updates = []
+            source, source_segment = None, None
+            
+            for module_id, segment, offset, length in rows:
+                if segment != source_segment:
+                    if source:
+                        source.close()
+                    source, source_segment = open(self.segment_path(segment), 'rb'), segment
+                
+                source.seek(offset)
+                record = source.read(length)
+                handle = self._open_active()
+                updates.append((self.active_segment, handle.tell(), module_id))
+                handle.write(record)
+            
+            if source:
+                source.close()
+            if self.handle:
+                self.handle.flush()
+                os.fsync(self.handle.fileno())
+            
+            with self.db:
+                self.db.executemany("UPDATE modules SET segment = ?, offset = ? WHERE id = ?", updates)
+            
+            for segment in old_segments:
+                self.segment_path(segment).unlink()
+            
+            after = sum(self.segment_path(n).stat().st_size for n in self.segment_numbers())
+            
+            return {"modules": len(rows), "bytes_before": before, "bytes_after": after}
+    
+    def import_files(self, directory: Path, batch_size: int = 1000) -> int:
+        """Import unique de l'ancien format un-fichier-par-module ({id}.json)"""
+        imported = 0
+        batch = []
+        
+        for module in iter_module_files(directory):
+            batch.append(module)
+            if len(batch) >= batch_size:
+                imported += self.append(batch)
+                batch = []
+        
+        imported += self.append(batch)
+        return imported
+    
+    def close(self):
+        """Ferme le segment actif et l'index, libère le verrou"""
+        with self.lock:
+            if self.handle:
+                self.handle.close()
+                self.handle = None
+            self.db.close()
+            if self.lock_file:
+                self.lock_file.close()
+                self.lock_file = None
+
+# Export des modules (JSON Lines / CSV)
+EXPORT_FORMATS = ("jsonl", "csv")
+EXPORT_CSV_FIELDS = ("id", "name", "level", "genes", "status", "created_at", "hash")
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+def iter_module_files(directory: Path) -> Iterator[MSYModule]:
+    """Modules du format un-fichier-par-module ({id}.json), lus un à un"""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if not (entry.name.endswith(".json") and entry.name.startswith("MSY_GEN_")):
+                continue
+            
+            try:
+                with open(entry.path, 'r') as f:
+                    module = MSYModule(**json.load(f))
+            except (OSError, ValueError, TypeError) as e:
+                print(f"⚠️  Module ignoré {entry.name}: {e}", file=sys.stderr)
+                continue
+            
+            yield module
+
+def filter_modules(modules: Iterator[MSYModule], level: Optional[int] = None, gene: Optional[str] = None,
+                   status: Optional[str] = None, since: Optional[str] = None,
+                   until: Optional[str] = None) -> Iterator[MSYModule]:
+    """Mêmes filtres que MSYModuleStore.query, appliqués à un flux de modules"""
+    for module in modules:
+        if level is not None and module.level != level:
+            continue
+        if gene is not None and gene not in module.genes:
+            continue
+        if status is not None and module.status != status:
+            continue
+        if since is not None and module.created_at < since:
+            continue
+        if until is not None and module.created_at >= until:
+            continue
+        yield module
+
+def resolve_source(target_dir: Path, source: str = "auto", backend: Optional[str] = None) -> str:
+    """
+    Source effective ("store" ou "files") d'une cible. `auto` suit le
+    backend configuré (storage.backend) : après import-legacy, les anciens
+    fichiers restent à côté du store. Backend inconnu : le seul format
+    présent, ValueError si les deux existent (ambigu).
+    """
+    if source != "auto":
+        return source
+    
+    has_store = (target_dir / "store" / "index.sqlite3").exists()
+    if backend == "files" or (backend == "segments" and not has_store):
+        return "files"
+    if backend == "segments":
+        return "store"
+    
+    has_files = target_dir.is_dir() and next(target_dir.glob("MSY_GEN_*.json"), None) is not None
+    if has_store and has_files:
+        raise ValueError(f"{target_dir} contient un store segments et des fichiers {{id}}.json : "
+                         "préciser la source (storage.backend ou --source)")
+    return "store" if has_store else "files"
+
+def iter_modules(target_dir: Path, source: str = "auto", raw: bool = False,
+                 backend: Optional[str] = None, **filters) -> Iterator:
+    """
+    Modules d'une cible Triple Path : store segments (filtres indexés) ou
+    fichiers {id}.json, selon resolve_source (`backend` = storage.backend).
+    Le store est ouvert en lecture seule (FileNotFoundError s'il n'existe pas).
+    `raw` : le store renvoie ses lignes JSON brutes (bytes) sans décodage.
+    """
+    store_dir = target_dir / "store"
+    
+    if resolve_source(target_dir, source, backend) == "store":
+        store = MSYModuleStore(store_dir, read_only=True)
+        try:
+            yield from store.records(**filters) if raw else store.query(**filters)
+        finally:
+            store.close()
+    else:
+        yield from filter_modules(iter_module_files(target_dir), **filters)
+
+def export_modules(modules: Iterator, fmt: str = "jsonl", compress: bool = False,
+                   chunk_bytes: int = EXPORT_CHUNK_BYTES) -> Iterator[bytes]:
+    """
+    Sérialise un flux de modules en JSON Lines ou CSV (gènes séparés par
+    « ; »), par blocs d'environ `chunk_bytes`, compressés gzip à la volée
+    si `compress`. Les lignes brutes du store (bytes) sont recopiées telles
+    quelles en JSON Lines. Mémoire constante : rien n'est accumulé.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Format d'export inconnu: {fmt}")
+    
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS) if compress else None
+    text = io.StringIO()
+    writer = csv.writer(text) if fmt == "csv" else None
+    parts: List[bytes] = []
+    size = 0
+    
+    if writer:
+        writer.writerow(EXPORT_CSV_FIELDS)
+    
+    for module in modules:
+        if fmt == "jsonl":
+            line = module if isinstance(module, bytes) else (json.dumps(asdict(module), ensure_ascii=False) + "\n").encode()
+        else:
+            if isinstance(module, bytes):
+                module = MSYModule(**json.loads(module))
+            writer.writerow([module.id, module.name, module.level, ";".join(module.genes),
+                             module.status, module.created_at, module.hash])
+            line = text.getvalue().encode()
+            text.seek(0)
+            text.truncate()
+        
+        parts.append(line)
+        size += len(line)
+        
+        if size >= chunk_bytes:
+            chunk = b"".join(parts)
+            parts, size = [], 0
+            
+            chunk = compressor.compress(chunk) if compressor else chunk
+            if chunk:
+                yield chunk
+    
+    chunk = text.getvalue().encode() + b"".join(parts)
+    if compressor:
+        chunk = compressor.compress(chunk) + compressor.flush()
+    if chunk:
+        yield chunk
+
+class MSYTriplePathWriter:
+    """
+    Réplication Triple Path asynchrone.
+
+    Un thread d'écriture par cible : une cible lente (/mnt/*) ne bloque ni
+    les autres cibles ni le cycle d'évolution. Chaque fichier est écrit
+    atomiquement (fichier temporaire + rename) ; le log quotidien garde un
+    seul handle bufferisé. Les échecs sont comptés par cible, jamais levés.
+    Backend "files" ({id}.json) ou "segments" (MSYModuleStore par cible).
+    """
+    
+    def __init__(self, targets: Dict[str, Path], logs_dir: Path, backend: str = "files",
+                 segment_max_bytes: int = 64 * 1024 * 1024):
+        self.targets = dict(targets)
+        self.logs_dir = logs_dir
+        self.backend = backend
+        self.segment_max_bytes = segment_max_bytes
+        self.stores: Dict[str, MSYModuleStore] = {}
+        self.stores_lock = threading.Lock()
+        self.ready_dirs = set()
+        self.executors = {
+            name: ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"msy-triple-{name}")
+            for name in self.targets
+        }
+        self.pending: List[Future] = []
+        self.target_stats = {
+            name: {"batches": 0, "written": 0, "failed": 0, "last_latency_ms": 0.0, "max_latency_ms": 0.0, "last_error": None}
+            for name in self.targets
+        }
+        self.stats_lock = threading.Lock()
+        self.log_handle = None
+        self.log_day = None
+    
+    def submit(self, modules: List[MSYModule]) -> List[Future]:
+        """Planifie l'écriture d'un lot sur les 3 cibles (non bloquant)"""
+        if not modules:
+            return []
+        
+        # Sérialisation unique, partagée par les 3 cibles
+        if self.backend == "segments":
+            write, payload = self._append_target, modules
+        else:
+            write, payload = self._write_target, [(module.id, json.dumps(asdict(module), indent=2)) for module in modules]
+        
+        futures = [
+            self.executors[name].submit(write, name, path_dir, payload)
+            for name, path_dir in self.targets.items()
+        ]
+        self.pending.extend(futures)
+        
+        self.log_modules(modules)
+        
+        return futures
+    
+    def write(self, modules: List[MSYModule]) -> List[Dict]:
+        """Écrit un lot et attend les 3 cibles"""
+        return [future.result() for future in self.submit(modules)]
+    
+    def store(self, name: str, blocking: bool = True) -> MSYModuleStore:
+        """Store segments d'une cible (ouvert à la première utilisation, cf. verrou MSYModuleStore)"""
+        with self.stores_lock:
+            if name not in self.stores:
+                self.stores[name] = MSYModuleStore(self.targets[name] / "store", self.segment_max_bytes, blocking=blocking)
+            return self.stores[name]
+    
+    def _append_target(self, name: str, path_dir: Path, modules: List[MSYModule]) -> Dict:
+        """Ajoute un lot au store segments d'une cible (thread de la cible)"""
+        start = time.perf_counter()
+        written = 0
+        errors = []
+        
+        try:
+            written = self.store(name).append(modules)
+        except (OSError, sqlite3.Error) as e:
+            errors.append(str(e))
+        
+        return self._report(name, start, len(modules), written, errors)
+    
+    def _write_target(self, name: str, path_dir: Path, payloads: List) -> Dict:
+        """Écrit un lot sur une cible (thread de la cible)"""
+        start = time.perf_counter()
+        written = 0
+        errors = []
+        
+        # Répertoire créé au premier lot de la cible
+        if path_dir not in self.ready_dirs:
+            try:
+                path_dir.mkdir(parents=True, exist_ok=True)
+                self.ready_dirs.add(path_dir)
+            except OSError as e:
+                errors.append(str(e))
+        
+        if not errors:
+            for module_id, data in payloads:
+                tmp_file = path_dir / f".{module_id}.json.tmp"
+                
+                try:
+                    with open(tmp_file, 'w') as f:
+                        f.write(data)
+                    os.replace(tmp_file, path_dir / f"{module_id}.json")
+                    written += 1
+                except OSError as e:
+                    errors.append(f"{module_id}: {e}")
+        
+        return self._report(name, start, len(payloads), written, errors)
+    
+    def _report(self, name: str, start: float, total: int, written: int, errors: List[str]) -> Dict:
+        """Met à jour les compteurs de la cible et retourne le rapport du lot"""
+        latency_ms = (time.perf_counter() - start) * 1000
+        failed = total - written
+        
+        with self.stats_lock:
+            stats = self.target_stats[name]
+            stats["batches"] += 1
+            stats["written"] += written
+            stats["failed"] += failed
+            stats["last_latency_ms"] = round(latency_ms, 3)
+            stats["max_latency_ms"] = round(max(stats["max_latency_ms"], latency_ms), 3)
+            if errors:
+                stats["last_error"] = errors[-1]
+        
+        return {"target": name, "written": written, "failed": failed, "latency_ms": latency_ms, "errors": errors}
+    
+    def log_modules(self, modules: List[MSYModule]):
+        """Log quotidien (handle bufferisé, rouvert au changement de jour)"""
+        now = datetime.now()
+        day = f"{now:%Y%m%d}"
+        
+        if self.log_day != day:
+            if self.log_handle:
+                self.log_handle.close()
+            self.logs_dir.mkdir(parents=True, exist_ok=True)
+            self.log_handle = open(self.logs_dir / f"genesy_{day}.log", 'a', buffering=64 * 1024)
+            self.log_day = day
+        
+        for module in modules:
+            self.log_handle.write(f"[{now:%Y-%m-%d %H:%M:%S}] Module généré: {module.id} | Level: {module.level} | Genes: {len(module.genes)}\n")
+        self.log_handle.flush()
+    
+    def snapshot_stats(self) -> Dict[str, Dict]:
+        """Copie des compteurs par cible (latence, échecs)"""
+        with self.stats_lock:
+            return {name: dict(stats) for name, stats in self.target_stats.items()}
+    
+    def collect(self, timeout: Optional[float] = 0) -> List[Dict]:
+        """Rapports des lots terminés (attend au plus `timeout` secondes, None = tout)"""
+        if not self.pending:
+            return []
+        
+        done, not_done = wait(self.pending, timeout=timeout)
+        self.pending = [future for future in self.pending if future in not_done]
+        
+        return [future.result() for future in done]
+    
+    def close(self) -> List[Dict]:
+        """Termine les écritures en cours et ferme le log"""
+        reports = self.collect(timeout=None)
+        
+        for executor in self.executors.values():
+            executor.shutdown(wait=True)
+        
+        with self.stores_lock:
+            for store in self.stores.values():
+                store.close()
+            self.stores.clear()
+        
+        if self.log_handle:
+            self.log_handle.close()
+            self.log_handle = None
+            self.log_day = None
+        
+        return reports
+
+class MSYCheckpointer:
+    """
+    Checkpoints binaires de l'état d'évolution (.npz).
+
+    Contient les tableaux de la population, l'état des générateurs
+    aléatoires (`random` + NumPy), les stats et l'empreinte de config.
+    L'instantané est pris dans le thread du cycle ; l'écriture (fichier
+    temporaire + fsync + rename) se fait sur un thread de fond.
+    """
+    
+    VERSION = 2
+    ARRAYS = ("genes", "levels", "status", "created_at", "uids", "scores", "saved")
+    
+    def __init__(self, path: Path):
+        self.path = path
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="msy-checkpoint")
+        self.pending: Optional[Future] = None
+        self.last_error: Optional[str] = None
+    
+    def snapshot(self, population: MSYPopulation, meta: Dict) -> Dict:
+        """Copie de l'état (le cycle peut continuer pendant l'écriture)"""
+        arrays = {name: getattr(population, name).copy() for name in self.ARRAYS}
+        arrays["meta"] = np.frombuffer(json.dumps(dict(meta, version=self.VERSION, count=len(population))).encode(), dtype=np.uint8)
+        return arrays
+    
+    def save(self, population: MSYPopulation, meta: Dict) -> bool:
+        """Planifie un checkpoint (ignoré si le précédent est encore en cours)"""
+        if self.pending is not None and not self.pending.done():
+            return False
+        
+        self.pending = self.executor.submit(self._write, self.snapshot(population, meta))
+        return True
+    
+    def _write(self, arrays: Dict) -> float:
+        """Écriture atomique (thread de fond), retourne la durée en secondes"""
+        start = time.perf_counter()
+        tmp_file = self.path.with_name(self.path.name + ".tmp")
+        
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, 'wb') as f:
+                np.savez(f, **arrays)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.path)
+            self.last_error = None
+        except OSError as e:
+            self.last_error = str(e)
+            print(f"⚠️  Checkpoint échoué: {e}")
+        
+        return time.perf_counter() - start
+    
+    def load(self, config_hash: str, gene_names: List[str]):
+        """
+        Charge le dernier checkpoint valide.
+
+        Retourne (population, meta) ou None si absent, corrompu, d'une autre
+        version, ou produit avec une autre config / table de gènes.
+        """
+        if not self.path.exists():
+            return None
+        
+        try:
+            with np.load(self.path) as data:
+                meta = json.loads(data["meta"].tobytes())
+                
+                if meta.get("version") != self.VERSION:
+                    raise ValueError(f"version {meta.get('version')}")
+                if meta.get("config_hash") != config_hash:
+                    raise ValueError("config modifiée")
+                if meta.get("gene_names") != gene_names:
+                    raise ValueError("table de gènes modifiée")
+                
+                population = MSYPopulation(**{name: data[name] for name in self.ARRAYS}, scored_at=meta.get("scored_at"))
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile) as e:
+            print(f"⚠️  Checkpoint ignoré ({self.path.name}): {e}")
+            return None
+        
+        if any(len(getattr(population, name)) != meta["count"] for name in self.ARRAYS):
+            print(f"⚠️  Checkpoint ignoré ({self.path.name}): tailles incohérentes")
+            return None
+        
+        return population, meta
+    
+    def close(self):
+        """Attend la fin de l'écriture en cours"""
+        self.executor.shutdown(wait=True)
+
+class MSYGitHubSync:
+    """
+    Synchronisation GitHub en tâche de fond (API Git Data).
+
+    Chaque lot (rapport de cycle + modules) est poussé en un seul commit :
+    ref -> commit parent -> arbre (contenus inline, base_tree) -> commit ->
+    mise à jour de la ref. Les lots en attente sont fusionnés dans le même
+    commit. File bornée : `submit` ne bloque jamais le cycle (lot ignoré si
+    pleine). Session HTTP avec pool de connexions ; en-têtes de rate limit
+    et Retry-After respectés, backoff exponentiel sur erreurs 5xx/réseau.
+    `api_url` permet de viser un serveur GitHub local (msy_genesy_github_mock.py).
+    """
+    
+    def __init__(self, token: str, owner: str, repo: str, branch: str = "main",
+                 api_url: str = "https://api.github.com", path_prefix: str = "genesy",
+                 queue_size: int = 8, max_retries: int = 5, timeout: float = 30.0):
+        import requests
+        from requests.adapters import HTTPAdapter
+        
+        self.repo_url = f"{api_url.rstrip('/')}/repos/{owner}/{repo}"
+        self.branch = branch
+        self.path_prefix = path_prefix.strip('/')
+        self.max_retries = max_retries
+        self.timeout = timeout
+        
+        self.session = requests.Session()
+        self.session.mount(api_url, HTTPAdapter(pool_connections=1, pool_maxsize=4))
+        self.session.headers.update({
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+            "User-Agent": "msy-genesy"
+        })
+        
+        self.queue: "queue.Queue[Optional[Dict]]" = queue.Queue(maxsize=queue_size)
+        self.stop = threading.Event()
+        self.stats = {"commits": 0, "files": 0, "requests": 0, "retries": 0, "dropped": 0, "failed": 0,
+                      "last_commit": None, "last_error": None}
+        
+        self.thread = threading.Thread(target=self._run, name="msy-github-sync", daemon=True)
+        self.thread.start()
+    
+    def submit(self, files: Dict[str, str], message: str) -> bool:
+        """Planifie un commit {chemin: contenu} (False si la file est pleine)"""
+        try:
+            self.queue.put_nowait({"files": files, "message": message})
+        except queue.Full:
+            self.stats['dropped'] += 1
+            print(f"⚠️  Sync GitHub saturée : lot ignoré ({len(files)} fichiers)")
+            return False
+        return True
+    
+    def _run(self):
+        while True:
+            batch = self.queue.get()
+            if batch is None:
+                return
+            
+            # Fusionner les lots déjà en attente (un seul commit)
+            closing = False
+            files, messages = dict(batch['files']), [batch['message']]
+            while True:
+                try:
+                    extra = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if extra is None:
+                    closing = True
+                    break
+                files.update(extra['files'])
+                messages.append(extra['message'])
+            
+            try:
+                self.commit(files, "\n".join(messages))
+            except Exception as e:
+                self.stats['failed'] += 1
+                self.stats['last_error'] = str(e)
+                print(f"❌ Sync GitHub échouée: {e}")
+            
+            if closing:
+                return
+    
+    def request(self, method: str, path: str, payload: Optional[Dict] = None) -> Dict:
+        """Appel API avec rate limit, Retry-After et backoff exponentiel"""
+        import requests
+        
+        for attempt in range(self.max_retries + 1):
+            self.stats['requests'] += 1
+            delay = None
+            
+            try:
+                response = self.session.request(method, self.repo_url + path, json=payload, timeout=self.timeout)
+            except requests.RequestException as e:
+                response, error = None, str(e)
+            else:
+                error = f"HTTP {response.status_code} {method} {path}"
+                if response.ok:
+                    self.respect_rate_limit(response)
+                    return response.json() if response.content else {}
+                
+                # Limite atteinte : Retry-After, sinon reset de la fenêtre
+                if response.status_code in (403, 429):
+                    if 'Retry-After' in response.headers:
+                        delay = float(response.headers['Retry-After'])
+                    elif response.headers.get('X-RateLimit-Remaining') == '0':
+                        delay = max(0.0, float(response.headers.get('X-RateLimit-Reset', 0)) - time.time()) + 1
+                
+                if delay is None and response.status_code < 500:
+                    raise RuntimeError(f"{error}: {response.text[:200]}")
+            
+            if attempt == self.max_retries:
+                raise RuntimeError(error)
+            
+            self.stats['retries'] += 1
+            if delay is None:
+                delay = min(60.0, 2 ** attempt) * (0.5 + random.random() / 2)
+            if self.stop.wait(delay):
+                raise RuntimeError(f"{error} (arrêt pendant l'attente)")
+    
+    def respect_rate_limit(self, response):
+        """Fenêtre épuisée : attendre le reset avant l'appel suivant"""
+        if response.headers.get('X-RateLimit-Remaining') == '0':
+            self.stop.wait(max(0.0, float(response.headers.get('X-RateLimit-Reset', 0)) - time.time()) + 1)
+    
+    def commit(self, files: Dict[str, str], message: str) -> str:
+        """Un commit pour tous les fichiers (nouvel essai si la branche a avancé)"""
+        tree = [
+            {"path": f"{self.path_prefix}/{path}" if self.path_prefix else path,
+             "mode": "100644", "type": "blob", "content": content}
+            for path, content in files.items()
+        ]
+        
+        for attempt in range(3):
+            head = self.request("GET", f"/git/ref/heads/{self.branch}")['object']['sha']
+            base_tree = self.request("GET", f"/git/commits/{head}")['tree']['sha']
+            new_tree = self.request("POST", "/git/trees", {"base_tree": base_tree, "tree": tree})['sha']
+            commit = self.request("POST", "/git/commits", {"message": message, "tree": new_tree, "parents": [head]})['sha']
+            
+            try:
+                self.request("PATCH", f"/git/refs/heads/{self.branch}", {"sha": commit, "force": False})
+            except RuntimeError as e:
+                # 422 : la branche a bougé entre-temps, on recommence sur la nouvelle tête
+                if "HTTP 422" in str(e) and attempt < 2:
+                    continue
+                raise
+            
+            self.stats['commits'] += 1
+            self.stats['files'] += len(files)
+            self.stats['last_commit'] = commit
+            self.stats['last_error'] = None
+            return commit
+    
+    def close(self, timeout: Optional[float] = 30.0):
+        """Pousse les lots en attente puis arrête le thread"""
+        try:
+            self.queue.put(None, timeout=timeout)
+        except queue.Full:
+            self.stop.set()
+        self.thread.join(timeout)
+        self.stop.set()
+        self.session.close()
 
 class MSYGenesyEngine:
     """
@@ -73,43 +1775,319 @@ class MSYGenesyEngine:
     
     Système d'évolution génétique pour génération automatique
     de modules MSY selon hiérarchie 8 niveaux.
+    
+    Les répertoires par défaut (MSY_GENESY_DIR, TRIPLE_PATH, MSY_LOGS_DIR)
+    peuvent être remplacés pour un moteur isolé (benchmarks).
     """
     
-    def __init__(self):
-        self.config_file = MSY_GENESY_DIR / "msy_genesy_config.json"
-        self.stats_file = MSY_GENESY_DIR / "msy_genesy_stats.json"
+    def __init__(self, genesy_dir: Optional[Path] = None, triple_path: Optional[Dict[str, Path]] = None,
+                 logs_dir: Optional[Path] = None):
+        self.genesy_dir = genesy_dir or MSY_GENESY_DIR
+        self.logs_dir = logs_dir or MSY_LOGS_DIR
         
-        # Créer structures
-        for path in [MSY_GENESY_DIR, MSY_GENERATED_DIR, MSY_LOGS_DIR]:
-            path.mkdir(parents=True, exist_ok=True)
+        # Démarrage rapide : Triple Path, répertoires, msy_config.env et
+        # writer sont résolus/créés à la première utilisation
+        self._triple_path = dict(triple_path) if triple_path else None
+        self._writer: Optional[MSYTriplePathWriter] = None
+        self._github: Optional[MSYGitHubSync] = None
+        self.msy_env = None
         
-        for path in TRIPLE_PATH.values():
-            path.mkdir(parents=True, exist_ok=True)
+        self.config_file = self.genesy_dir / "msy_genesy_config.json"
+        self.stats_file = self.genesy_dir / "msy_genesy_stats.json"
+        self.checkpoint_file = self.genesy_dir / "msy_genesy_checkpoint.npz"
         
         # Charger config
+        self.rejected_config = None
         self.load_config()
-        self.load_msy_env()
+        
+        # Gènes internés + générateur aléatoire population
+        self.gene_table = MSYGeneTable(self.config['genes_pool'], self.config.get('genes_traits'))
+        self.rng = np.random.default_rng(self.config['evolution_params'].get('seed'))
+        
+        # Instrumentation par étape (désactivée par défaut)
+        self.profiler = self.build_profiler()
+        
+        self.evolver = MSYEvolver(self.config['evolution_params'], self.gene_table, self.rng, profiler=self.profiler)
+        self.population: Optional[MSYPopulation] = None
+        self.last_evolution = None
+        self.previous_generations = None  # Générations du cycle précédent (scheduler adaptatif)
         
         # Stats
         self.stats = {
             "modules_generated": 0,
             "genes_mutated": 0,
             "evolution_cycles": 0,
+            "evolution_generations": 0,
             "last_run": None,
             "vision_2030_progress": 0.0
         }
         self.load_stats()
+        
+        # Compteurs live (mmap lu par le dashboard /api/genesy)
+        try:
+            self.metrics = MSYMetricsWriter()
+        except OSError as e:
+            print(f"⚠️  Métriques live désactivées: {e}")
+            self.metrics = None
+        
+        # Événements d'évolution (flux SSE du dashboard)
+        try:
+            self.events = MSYEventWriter()
+        except OSError as e:
+            print(f"⚠️  Événements live désactivés: {e}")
+            self.events = None
+        
+        # Agrégats des modules sauvegardés (dashboard /api/genesy/aggregates)
+        self.aggregates_error = None
+        try:
+            self.aggregates = MSYAggregates(retention_days=self.config.get('aggregates', {}).get('retention_days', 90))
+        except OSError as e:
+            # Verrou tenu par un autre moteur : agrégats laissés à ce processus
+            print(f"⚠️  Agrégats désactivés: {e}")
+            self.aggregates = None
+            self.aggregates_error = str(e)
+        
+        # Reprise depuis le dernier checkpoint
+        self.checkpointer = MSYCheckpointer(self.checkpoint_file)
+        self.load_checkpoint()
+        
+        # Persistance de fin de cycle (stats, rapport, GitHub) en parallèle du cycle suivant
+        self.persistence = ThreadPoolExecutor(max_workers=1, thread_name_prefix="msy-persist")
+        self.persist_future: Optional[Future] = None
+        self.stop_event = threading.Event()
     
-    def load_msy_env(self):
-        """Charge variables MSY depuis config unifiée"""
-        self.msy_env = {}
+    @property
+    def triple_path(self) -> Dict[str, Path]:
+        """Triple Path (résolu à la première utilisation)"""
+        if self._triple_path is None:
+            self._triple_path = dict(resolve_triple_path())
+        return self._triple_path
+    
+    @property
+    def writer(self) -> "MSYTriplePathWriter":
+        """Réplication Triple Path asynchrone (créée à la première sauvegarde)"""
+        if self._writer is None:
+            storage = self.config.get('storage', {})
+            self._writer = MSYTriplePathWriter(
+                self.triple_path, self.logs_dir,
+                backend=storage.get('backend', 'files'),
+                segment_max_bytes=storage.get('segment_max_mb', 64) * 1024 * 1024
+            )
+        return self._writer
+    
+    @property
+    def github(self) -> Optional[MSYGitHubSync]:
+        """Sync GitHub de fond (créée au premier cycle avec token, sinon None)"""
+        if self._github is None:
+            self.load_msy_env()
+            settings = self.config.get('github', {})
+            
+            if self.github_token and settings.get('enabled', True):
+                self._github = MSYGitHubSync(
+                    self.github_token, self.github_user, self.github_repo,
+                    branch=self.msy_env.get('MSY_GITHUB_BRANCH') or os.environ.get('MSY_GITHUB_BRANCH') or settings.get('branch', 'main'),
+                    api_url=self.msy_env.get('MSY_GITHUB_API_URL') or os.environ.get('MSY_GITHUB_API_URL') or "https://api.github.com",
+                    path_prefix=settings.get('path', 'genesy'),
+                    queue_size=settings.get('queue_size', 8),
+                    max_retries=settings.get('max_retries', 5),
+                    timeout=settings.get('timeout', 30)
+                )
+        return self._github
+    
+    def close(self):
+        """Termine les écritures en cours (persistance, Triple Path, checkpoint, GitHub)"""
+        self.persistence.shutdown(wait=True)
+        if self._writer is not None:
+            self._writer.close()
+        self.checkpointer.close()
+        if self._github is not None:
+            self._github.close()
+        self.save_aggregates()
+        if self.aggregates is not None:
+            self.aggregates.close()
+    
+    def build_profiler(self) -> MSYProfiler:
+        """Profileur selon la section 'profiling' de la config courante"""
+        profiling = self.config.get('profiling', {})
+        self.profiling_config = profiling
+        
+        return MSYProfiler(
+            enabled=profiling.get('enabled', False),
+            sampling=profiling.get('sampling', False),
+            sample_interval_ms=profiling.get('sample_interval_ms', 5),
+            top_functions=profiling.get('top_functions', 15),
+            prometheus_file=Path(profiling['prometheus_file']) if profiling.get('prometheus_file') else self.logs_dir / "msy_genesy.prom"
+        )
+    
+    def validate_config(self, config: Dict) -> List[str]:
+        """Erreurs bloquantes d'une config (liste vide = valide)"""
+        errors = []
+        
+        pool = config.get('genes_pool')
+        if not isinstance(pool, dict) or not pool or not all(
+            isinstance(genes, list) and genes and all(isinstance(gene, str) for gene in genes) for genes in pool.values()
+        ):
+            errors.append("genes_pool : types -> listes de gènes non vides")
+        elif sum(len(genes) for genes in pool.values()) > np.iinfo(GENE_ID_DTYPE).max:
+            errors.append("genes_pool : trop de gènes")
+        
+        traits = config.get('genes_traits', {})
+        if not isinstance(traits, dict) or not all(
+            isinstance(trait, dict)
+            and is_number(trait.get('power', GENE_DEFAULT_POWER)) and 0 <= trait.get('power', GENE_DEFAULT_POWER) <= 1
+            and isinstance(trait.get('compatibility', []), list)
+            and all(isinstance(gene, str) for gene in trait.get('compatibility', []))
+            for trait in traits.values()
+        ):
+            errors.append("genes_traits : {gène: {power: nombre entre 0 et 1, compatibility: [gènes]}}")
+        
+        hierarchy = config.get('hierarchy_8_levels')
+        if not isinstance(hierarchy, dict) or any(str(level) not in hierarchy for level in range(1, 9)):
+            errors.append("hierarchy_8_levels : niveaux 1 à 8 requis")
+        
+        params = config.get('evolution_params')
+        if not isinstance(params, dict):
+            return errors + ["evolution_params manquant"]
+        
+        def check(section: Dict, prefix: str, key: str, low: float, high: Optional[float] = None,
+                  integer: bool = False, required: bool = False):
+            # Clé absente : défaut du moteur (sauf clé obligatoire)
+            if key not in section and not required:
+                return
+            value = section.get(key)
+            if not (is_number(value) and (not integer or isinstance(value, int))
+                    and value >= low and (high is None or value <= high)):
+                kind = "entier" if integer else "nombre"
+                errors.append(f"{prefix}.{key} : {kind} >= {low}" + (f" et <= {high}" if high is not None else ""))
+        
+        for key in ('mutation_rate', 'crossover_rate', 'selection_pressure', 'fitness_threshold'):
+            check(params, "evolution_params", key, 0, 1, required=True)
+        check(params, "evolution_params", 'generation_size', 2, integer=True, required=True)
+        check(params, "evolution_params", 'max_generations', 1, integer=True)
+        check(params, "evolution_params", 'plateau_generations', 1, integer=True)
+        check(params, "evolution_params", 'plateau_tolerance', 0)
+        check(params, "evolution_params", 'freshness_tolerance', 0)
+        check(params, "evolution_params", 'gene_synergy_weight', 0, 1)
+        check(params, "evolution_params", 'tournament_size', 1, integer=True)
+        
+        if params.get('selection', 'truncation') not in SELECTION_STRATEGIES:
+            errors.append(f"evolution_params.selection : {', '.join(SELECTION_STRATEGIES)}")
+        if params.get('parent_selection', 'fitness') not in PARENT_SELECTIONS:
+            errors.append(f"evolution_params.parent_selection : {', '.join(PARENT_SELECTIONS)}")
+        if params.get('seed') is not None and not (isinstance(params['seed'], int) and params['seed'] >= 0):
+            errors.append("evolution_params.seed : null ou entier >= 0")
+        
+        islands = params.get('islands', {})
+        if not isinstance(islands, dict):
+            errors.append("evolution_params.islands : objet {count, migration_interval, migrants, epochs}")
+            islands = {}
+        check(islands, "evolution_params.islands", 'count', 1, integer=True)
+        check(islands, "evolution_params.islands", 'migration_interval', 1, integer=True)
+        check(islands, "evolution_params.islands", 'epochs', 1, integer=True)
+        check(islands, "evolution_params.islands", 'migrants', 0, integer=True)
+        
+        # Au moins un survivant par génération (population entière et chaque île)
+        if not errors:
+            sizes = [params['generation_size']]
+            if islands.get('count', 1) > 1:
+                sizes.append(max(2, params['generation_size'] // islands['count']))
+            if int(min(sizes) * params['selection_pressure']) < 1:
+                errors.append(f"evolution_params.selection_pressure : aucun survivant sur {min(sizes)} modules")
+        
+        return errors
+    
+    def reload_config(self, population: Optional[MSYPopulation] = None) -> Optional[MSYPopulation]:
+        """
+        Rechargement à chaud de msy_genesy_config.json, entre deux générations.
+        
+        Détection par mtime (CONFIG_CACHE : un stat par appel). La nouvelle
+        config est validée puis basculée d'un bloc ; seules les structures
+        dérivées concernées sont reconstruites (table de gènes + tables
+        d'alias, remappage des IDs de la population par nom, taille de
+        population, paramètres de l'évolueur). Retourne la population adaptée
+        (None si les types de gènes ont changé : nouvelle population).
+        """
+        if not self.config.get('hot_reload', True):
+            return population
+        
+        try:
+            config = CONFIG_CACHE.load(self.config_file, json.load)
+        except (OSError, ValueError) as e:
+            # Fichier en cours d'écriture ou JSON invalide : config courante conservée
+            print(f"⚠️  Config illisible ({self.config_file.name}) : {e}")
+            return population
+        
+        if config is None or config is self.config or config is self.rejected_config:
+            return population
+        
+        old = self.config
+        if config == old:
+            # Fichier réécrit à l'identique : rien à reconstruire
+            self.config = config
+            self.evolver.params = config['evolution_params']
+            return population
+        
+        # Structures dérivées construites avant la bascule (échec = config rejetée)
+        errors = self.validate_config(config)
+        gene_table = self.gene_table
+        if not errors and (config['genes_pool'] != old['genes_pool'] or config.get('genes_traits') != old.get('genes_traits')):
+            try:
+                gene_table = MSYGeneTable(config['genes_pool'], config.get('genes_traits'))
+            except (ValueError, TypeError, KeyError) as e:
+                errors.append(f"table de gènes : {e}")
+        
+        if errors:
+            self.rejected_config = config
+            print(f"⚠️  Config rejetée ({self.config_file.name}) : " + " ; ".join(errors))
+            return population
+        
+        if population is not None:
+            population = self.adapt_population(population, gene_table, config['evolution_params'])
+        
+        # Bascule
+        self.config = config
+        self.gene_table = self.evolver.gene_table = gene_table
+        self.evolver.params = config['evolution_params']
+        
+        changed = sorted(key for key in set(config) | set(old) if config.get(key) != old.get(key))
+        print(f"🔄 Config rechargée à chaud : {', '.join(changed)}")
+        
+        return population
+    
+    def adapt_population(self, population: MSYPopulation, gene_table: MSYGeneTable, params: Dict) -> Optional[MSYPopulation]:
+        """Population existante adaptée à une nouvelle table de gènes / de nouveaux paramètres"""
+        rescore = params.get('gene_synergy_weight', 0.0) != self.evolver.params.get('gene_synergy_weight', 0.0)
+        
+        if gene_table is not self.gene_table:
+            if len(gene_table.pools) != population.width:
+                print("⚠️  Types de gènes modifiés : nouvelle population")
+                return None
+            
+            # IDs remappés par nom ; gènes retirés remplacés dans le pool du type de la colonne
+            mapping = np.array([gene_table.ids.get(name, -1) for name in self.gene_table.names], dtype=np.int64)
+            genes = mapping[population.genes]
+            
+            for column, pool in enumerate(gene_table.pools):
+                missing = np.flatnonzero(genes[:, column] < 0)
+                genes[missing, column] = pool[self.rng.integers(len(pool), size=len(missing))]
+            
+            population.genes = genes.astype(GENE_ID_DTYPE)
+            rescore = True
+        
+        if rescore:
+            population.scores = np.full(len(population), np.nan)
+            population.scored_at = None
         
-        if MSY_CONFIG_PATH.exists():
-            with open(MSY_CONFIG_PATH, 'r') as f:
-                for line in f:
-                    if '=' in line and not line.strip().startswith('#'):
-                        key, value = line.strip().split('=', 1)
-                        self.msy_env[key] = value.strip('"').strip("'")
+        # generation_size réduit : on garde les meilleurs
+        if len(population) > params['generation_size']:
+            fitness = population.fitness(None, gene_table, params.get('gene_synergy_weight', 0.0))
+            population = population.take(np.sort(top_k(fitness, params['generation_size'])))
+        
+        return population
+    
+    def load_msy_env(self):
+        """Charge variables MSY depuis config unifiée (cache par mtime)"""
+        self.msy_env = CONFIG_CACHE.load(MSY_CONFIG_PATH, parse_msy_env) or {}
         
         # Variables critiques
         self.github_token = self.msy_env.get('MSY_GITHUB_TOKEN', '')
@@ -117,10 +2095,22 @@ class MSYGenesyEngine:
         self.github_repo = self.msy_env.get('MSY_GITHUB_ORG', 'MSY-CORE')
     
     def load_config(self):
-        """Charge configuration GENESY"""
-        if self.config_file.exists():
-            with open(self.config_file, 'r') as f:
-                self.config = json.load(f)
+        """Charge configuration GENESY (cache par mtime) ; invalide = config par défaut, fichier conservé"""
+        try:
+            config = CONFIG_CACHE.load(self.config_file, json.load)
+        except ValueError as e:
+            print(f"⚠️  Config illisible ({self.config_file.name}) : {e} - config par défaut")
+            self.config = self.default_config()
+            return
+        
+        errors = self.validate_config(config) if config is not None else []
+        if errors:
+            # Pas de boucle de crash au redémarrage : défauts jusqu'à correction du fichier (rechargement à chaud)
+            print(f"⚠️  Config rejetée ({self.config_file.name}) : " + " ; ".join(errors) + " - config par défaut")
+            self.rejected_config = config
+            self.config = self.default_config()
+        elif config is not None:
+            self.config = config
         else:
             self.config = self.default_config()
             self.save_config()
@@ -202,12 +2192,70 @@ class MSYGenesyEngine:
                     "backup_automation", "disaster_recovery", "security_hardening"
                 ]
             },
+            "genes_traits": {
+                # power 0.0 - 1.0 (défaut 0.5) ; compatibility = gènes complémentaires
+                "quantum_sync": {"power": 0.9, "compatibility": ["ai_consensus", "monitoring_live"]},
+                "triple_path_replication": {"power": 0.8, "compatibility": ["backup_automation", "disaster_recovery"]},
+                "gpg_signing": {"power": 0.7, "compatibility": ["blockchain_audit", "security_hardening"]},
+                "vision_2030": {"power": 0.8, "compatibility": ["global_expansion"]},
+                "monitoring_live": {"power": 0.7, "compatibility": ["alerting_telegram"]}
+            },
             "evolution_params": {
                 "mutation_rate": 0.15,  # 15% chance de mutation
                 "crossover_rate": 0.70,  # 70% chance de crossover
                 "selection_pressure": 0.85,  # 85% meilleurs survivent
                 "generation_size": 50,  # 50 modules par génération
-                "fitness_threshold": 0.80  # 80% fitness minimum
+                "fitness_threshold": 0.80,  # 80% fitness minimum
+                "max_generations": 20,  # Générations max par cycle
+                "plateau_generations": 3,  # Arrêt si pas de gain pendant N générations
+                "plateau_tolerance": 0.001,  # Gain minimum de la meilleure fitness
+                "freshness_tolerance": FRESHNESS_TOLERANCE,  # Dérive fraîcheur avant recalcul complet
+                "gene_synergy_weight": 0.1,  # Part de la synergie (power x compatibilité) dans la fitness
+                "selection": "truncation",  # Survivants : "truncation", "tournament" ou "rank"
+                "tournament_size": 3,  # Modules par tournoi (selection = "tournament")
+                "parent_selection": "fitness",  # "fitness" (proportionnelle) ou "uniform"
+                "seed": None,  # Graine RNG (None = non reproductible)
+                "islands": {
+                    "count": 1,  # >1 = évolution multi-cœurs en îles
+                    "migration_interval": 5,  # Générations entre migrations
+                    "migrants": 2,  # Élites migrant vers l'île suivante
+                    "epochs": 4  # Nombre de périodes de migration par cycle
+                }
+            },
+            "hot_reload": True,  # Config relue entre générations si le fichier change
+            "profiling": {
+                "enabled": False,  # Chronos + histogrammes par étape, export Prometheus
+                "sampling": False,  # Profileur par échantillonnage (top fonctions par cycle)
+                "sample_interval_ms": 5,
+                "top_functions": 15,
+                "prometheus_file": None  # Défaut : MSY_LOGS_DIR/msy_genesy.prom
+            },
+            "checkpoint": {
+                "enabled": True,  # Reprise de l'évolution après redémarrage
+                "interval_cycles": 1  # Checkpoint tous les N cycles
+            },
+            "scheduler": {
+                "interval_seconds": 300,  # Cadence fixe (début de cycle à début de cycle)
+                "adaptive": False,  # Adapter l'intervalle au plateau / à la charge
+                "min_interval_seconds": 60,
+                "max_interval_seconds": 1800,
+                "backoff": 1.5,  # Facteur d'allongement / raccourcissement
+                "max_load": 1.0  # Charge (loadavg 1 min par CPU) au-delà de laquelle on ralentit
+            },
+            "github": {
+                "enabled": True,  # Push des rapports + modules (si MSY_GITHUB_TOKEN)
+                "branch": "main",  # Remplaçable par MSY_GITHUB_BRANCH
+                "path": "genesy",  # Répertoire cible dans le dépôt
+                "queue_size": 8,  # Lots en attente max (au-delà : ignorés)
+                "max_retries": 5,
+                "timeout": 30
+            },
+            "aggregates": {
+                "retention_days": 90  # Jours d'histogrammes de fitness conservés
+            },
+            "storage": {
+                "backend": "segments",  # "files" = un JSON par module, "segments" = store append-only
+                "segment_max_mb": 64  # Taille max d'un segment avant rotation
             },
             "vision_2030": {
                 "target_users": 100_000_000,
@@ -219,8 +2267,13 @@ class MSYGenesyEngine:
     
     def save_config(self):
         """Sauvegarde configuration"""
+        self.config_file.parent.mkdir(parents=True, exist_ok=True)
+        
         with open(self.config_file, 'w') as f:
             json.dump(self.config, f, indent=2)
+        
+        # Fichier écrit = config courante (pas de rechargement à chaud)
+        CONFIG_CACHE.store(self.config_file, self.config)
     
     def load_stats(self):
         """Charge statistiques"""
@@ -228,12 +2281,63 @@ class MSYGenesyEngine:
             with open(self.stats_file, 'r') as f:
                 self.stats.update(json.load(f))
     
-    def save_stats(self):
-        """Sauvegarde statistiques"""
-        self.stats['last_run'] = datetime.now().isoformat()
+    def save_stats(self, stats: Optional[Dict] = None):
+        """Sauvegarde statistiques (ou un instantané `stats` déjà daté)"""
+        if stats is None:
+            self.stats['last_run'] = datetime.now().isoformat()
+            stats = self.stats
+        self.stats_file.parent.mkdir(parents=True, exist_ok=True)
         
         with open(self.stats_file, 'w') as f:
-            json.dump(self.stats, f, indent=2)
+            json.dump(stats, f, indent=2)
+    
+    def config_hash(self) -> str:
+        """Empreinte des sections de config qui donnent leur sens à la population"""
+        payload = json.dumps([self.config['genes_pool'], self.config['hierarchy_8_levels']], sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+    
+    def save_checkpoint(self, wait: bool = False):
+        """Checkpoint population + générateurs aléatoires + stats (thread de fond)"""
+        if self.population is None or not self.config.get('checkpoint', {}).get('enabled', True):
+            return
+        
+        version, state, gauss_next = random.getstate()
+        meta = {
+            "config_hash": self.config_hash(),
+            "gene_names": self.gene_table.names,
+            "stats": self.stats,
+            "random_state": [version, list(state), gauss_next],
+            "rng_state": self.rng.bit_generator.state,
+            "scored_at": self.population.scored_at,
+            "created": datetime.now().isoformat()
+        }
+        
+        self.checkpointer.save(self.population, meta)
+        
+        if wait:
+            self.checkpointer.pending.result()
+    
+    def load_checkpoint(self) -> bool:
+        """Restaure population et générateurs aléatoires depuis le checkpoint"""
+        start = time.perf_counter()
+        loaded = self.checkpointer.load(self.config_hash(), self.gene_table.names)
+        
+        if loaded is None:
+            return False
+        
+        self.population, meta = loaded
+        
+        version, state, gauss_next = meta["random_state"]
+        random.setstate((version, tuple(state), gauss_next))
+        self.rng.bit_generator.state = meta["rng_state"]
+        
+        # Le fichier stats (écrit à chaque cycle) reste la référence
+        if not self.stats_file.exists():
+            self.stats.update(meta["stats"])
+        
+        print(f"♻️  Checkpoint restauré : {len(self.population)} modules ({meta['created']}) "
+              f"en {(time.perf_counter() - start) * 1000:.0f} ms")
+        return True
     
     def generate_module_id(self) -> str:
         """Génère ID unique module"""
@@ -254,21 +2358,43 @@ class MSYGenesyEngine:
         
         # Âge (modules récents = plus adaptés)
         age_hours = (datetime.now() - datetime.fromisoformat(module.created_at)).total_seconds() / 3600
-        freshness = max(0, 1 - (age_hours / 168))  # 1 semaine max
+        freshness = max(0, 1 - (age_hours / FRESHNESS_HOURS))  # 1 semaine max
         score += freshness * 0.2
         
         # Statut
-        status_scores = {
-            "ACTIF": 1.0,
-            "SYNCHRONISÉ": 0.9,
-            "OPTIMISÉ": 0.95,
-            "EN_TEST": 0.7,
-            "DEPRECATED": 0.3
-        }
-        score += status_scores.get(module.status, 0.5) * 0.2
+        score += STATUS_SCORES.get(module.status, 0.5) * 0.2
+        
+        # Synergie des gènes (même mélange que calculate_fitness_batch)
+        weight = self.config['evolution_params'].get('gene_synergy_weight', 0.0)
+        if weight:
+            synergy = self.gene_table.synergy_names([module.genes])[0]
+            score = (1 - weight) * score + weight * synergy
         
         return min(score, 1.0)
     
+    def calculate_fitness_population(self, population: List[MSYModule], at_creation: bool = False) -> np.ndarray:
+        """Calcule fitness de toute une population (passe vectorisée ; `at_creation` : fraîcheur à la création)"""
+        count = len(population)
+        levels = np.empty(count, dtype=np.uint8)
+        status_codes = np.empty(count, dtype=np.uint8)
+        unique_genes = np.empty(count, dtype=np.uint16)
+        gene_counts = np.empty(count, dtype=np.uint16)
+        created_epochs = np.empty(count, dtype=np.float64)
+        
+        for i, module in enumerate(population):
+            levels[i] = module.level
+            status_codes[i] = encode_status(module.status)
+            unique_genes[i] = len(set(module.genes))
+            gene_counts[i] = len(module.genes)
+            created_epochs[i] = datetime.fromisoformat(module.created_at).timestamp()
+        
+        # Synergie : modules de même largeur traités en une passe (gènes inconnus non internés)
+        weight = self.config['evolution_params'].get('gene_synergy_weight', 0.0)
+        synergy = self.gene_table.synergy_names([m.genes for m in population]) if weight and count else None
+        
+        now = created_epochs if at_creation else None
+        return calculate_fitness_batch(levels, status_codes, unique_genes, gene_counts, created_epochs, now, synergy, weight)
+    
     def mutate_genes(self, genes: List[str]) -> List[str]:
         """Mutation génétique"""
         mutated = genes.copy()
@@ -326,13 +2452,12 @@ class MSYGenesyEngine:
     def evolve_generation(self, population: List[MSYModule]) -> List[MSYModule]:
         """Évolution d'une génération"""
         
-        # Calculer fitness
-        fitness_scores = [(module, self.calculate_fitness(module)) for module in population]
-        fitness_scores.sort(key=lambda x: x[1], reverse=True)
+        # Calculer fitness (passe vectorisée)
+        fitness = self.calculate_fitness_population(population)
         
-        # Sélection (meilleurs survivent)
+        # Sélection (meilleurs survivent, sélection partielle)
         survivors_count = int(len(population) * self.config['evolution_params']['selection_pressure'])
-        survivors = [m for m, f in fitness_scores[:survivors_count]]
+        survivors = [population[i] for i in top_k(fitness, survivors_count)]
         
         # Nouvelle génération
         new_generation = survivors.copy()
@@ -357,25 +2482,296 @@ class MSYGenesyEngine:
         
         return new_generation
     
+    def generate_population(self, size: int) -> MSYPopulation:
+        """Génère une population initiale compacte"""
+        return self.evolver.generate_population(size)
+    
+    def evolve_population(self, population: MSYPopulation) -> MSYPopulation:
+        """Évolution d'une génération (population compacte)"""
+        mutations = self.evolver.mutations
+        evolved = self.evolver.evolve_population(population)
+        self.stats['genes_mutated'] += self.evolver.mutations - mutations
+        
+        return evolved
+    
+    def run_islands(self, population: Optional[MSYPopulation] = None) -> MSYPopulation:
+        """
+        Évolution multi-cœurs en modèle d'îles.
+
+        Chaque île évolue dans un processus du pool avec son propre flux
+        aléatoire, dérivé de self.rng à chaque cycle (reproductible avec
+        `seed`, sans rejouer les mêmes flux d'un cycle à l'autre) ; toutes les `migration_interval`
+        générations, les élites migrent entre îles. Une population existante
+        est répartie entre les îles. Retourne la population fusionnée, sans
+        les copies laissées par la migration (uid en double).
+        
+        Même bilan que evolve_generations, à chaque époque sur la population
+        fusionnée : événement SSE, arrêt au seuil / plateau, `max_generations`
+        (en plus de `epochs`), stats et last_evolution. Le rechargement à
+        chaud de la config n'a lieu qu'entre deux cycles en mode îles.
+        """
+        params = self.config['evolution_params']
+        islands = params['islands']
+        count = islands['count']
+        interval = islands.get('migration_interval', 5)
+        max_generations = min(islands.get('epochs', 4) * interval, params.get('max_generations', 1))
+        
+        # Taille totale conservée : generation_size réparti entre îles
+        island_params = dict(params, generation_size=max(2, params['generation_size'] // count))
+        cycle_seed = np.random.SeedSequence(int(self.rng.integers(2**63)))
+        rngs = [np.random.default_rng(seq) for seq in cycle_seed.spawn(count)]
+        now = int(time.time())
+        
+        if population is not None and len(population) >= count:
+            populations = [population.take(chunk) for chunk in np.array_split(np.arange(len(population)), count)]
+        else:
+            populations = [
+                MSYEvolver(island_params, self.gene_table, rng, now).generate_population(island_params['generation_size'])
+                for rng in rngs
+            ]
+        
+        progress = {"best": -np.inf, "stalled": 0}
+        stop = "max_generations"
+        generation = 0
+        merged = None
+        
+        with ProcessPoolExecutor(max_workers=min(count, os.cpu_count() or 1), mp_context=island_mp_context()) as pool:
+            while generation < max_generations:
+                step = min(interval, max_generations - generation)
+                futures = [
+                    pool.submit(evolve_island, island_params, self.gene_table, population, rng, step, now)
+                    for population, rng in zip(populations, rngs)
+                ]
+                
+                results = [future.result() for future in futures]
+                populations = [population for population, _, _ in results]
+                rngs = [rng for _, rng, _ in results]
+                self.stats['genes_mutated'] += sum(mutations for _, _, mutations in results)
+                generation += step
+                
+                # Bilan de l'époque sur la population fusionnée
+                merged = MSYPopulation.concat(populations).unique()
+                reason = self.track_generation(merged, self.evolver.score(merged), generation, progress, step)
+                if reason:
+                    stop = reason
+                    break
+                
+                # Pas de migration après la dernière époque
+                if generation < max_generations:
+                    populations = migrate_elites(
+                        populations, islands.get('migrants', 2), now,
+                        self.gene_table, params.get('gene_synergy_weight', 0.0),
+                        params.get('freshness_tolerance', FRESHNESS_TOLERANCE)
+                    )
+        
+        self.end_generations(generation, progress["best"], stop)
+        
+        return merged if merged is not None else MSYPopulation.concat(populations).unique()
+    
+    def top_candidates(self, population: MSYPopulation, fitness: np.ndarray, k: int = TOP_MODULES_PER_CYCLE) -> np.ndarray:
+        """Indices des k meilleurs modules non encore sauvegardés (fitness décroissante)"""
+        candidates = np.flatnonzero(~population.saved)
+        return candidates[top_k(fitness[candidates], k)]
+    
+    def evolve_generations(self, population: MSYPopulation) -> MSYPopulation:
+        """
+        Boucle multi-générations d'un cycle.
+
+        S'arrête après `max_generations`, dès que les meilleurs candidats
+        atteignent tous `fitness_threshold`, ou quand la meilleure fitness
+        stagne (`plateau_generations` générations sans gain > `plateau_tolerance`).
+        """
+        params = self.config['evolution_params']
+        progress = {"best": -np.inf, "stalled": 0}
+        stop = "max_generations"
+        generation = 0
+        
+        for generation in range(1, params.get('max_generations', 1) + 1):
+            # Config modifiée : bascule entre deux générations
+            if generation > 1:
+                population = self.reload_config(population)
+                params = self.config['evolution_params']
+                if population is None:
+                    population = self.generate_population(params['generation_size'])
+            
+            population = self.evolve_population(population)
+            reason = self.track_generation(population, self.evolver.score(population), generation, progress)
+            if reason:
+                stop = reason
+                break
+        
+        self.end_generations(generation, progress["best"], stop)
+        
+        return population
+    
+    def track_generation(self, population: MSYPopulation, fitness: np.ndarray, generation: int,
+                         progress: Dict, step: int = 1) -> Optional[str]:
+        """
+        Bilan après `step` générations : événement SSE, plateau (progress :
+        best, stalled) et seuil. Retourne la raison d'arrêt ou None.
+        """
+        params = self.config['evolution_params']
+        
+        # Plateau
+        generation_best = float(fitness.max()) if len(fitness) else 0.0
+        
+        if self.events:
+            self.events.publish(
+                "generation", self.stats['evolution_cycles'] + 1, generation,
+                generation_best, float(fitness.mean()) if len(fitness) else 0.0, self.stats['genes_mutated']
+            )
+        progress["stalled"] = 0 if generation_best > progress["best"] + params.get('plateau_tolerance', 0.001) else progress["stalled"] + step
+        progress["best"] = max(progress["best"], generation_best)
+        
+        # Seuil atteint : un lot complet de modules sauvegardables
+        candidates = self.top_candidates(population, fitness)
+        if len(candidates) == TOP_MODULES_PER_CYCLE and fitness[candidates[-1]] >= params['fitness_threshold']:
+            return "fitness_threshold"
+        
+        if progress["stalled"] >= params.get('plateau_generations', 3):
+            return "plateau"
+        
+        return None
+    
+    def end_generations(self, generations: int, best: float, stop: str):
+        """Stats et last_evolution en fin de boucle de générations"""
+        self.stats['evolution_generations'] = self.stats.get('evolution_generations', 0) + generations
+        self.last_evolution = {"generations": generations, "best_fitness": best, "stop": stop}
+    
+    def materialize_modules(self, population: MSYPopulation, indices) -> List[MSYModule]:
+        """Convertit les modules sélectionnés en MSYModule (IDs, noms, hash)"""
+        modules = []
+        
+        for i in indices:
+            genes = self.gene_table.decode(population.genes[i])
+            module_id = module_id_from_uid(population.uids[i], population.created_at[i])
+            level = int(population.levels[i])
+            level_info = self.config['hierarchy_8_levels'][str(level)]
+            
+            modules.append(MSYModule(
+                id=module_id,
+                name=f"{level_info['name']}_GEN_{len(genes)}",
+                level=level,
+                genes=genes,
+                status=STATUS_NAMES[population.status[i]],
+                created_at=datetime.fromtimestamp(int(population.created_at[i])).isoformat(),
+                hash=hashlib.sha256(module_id.encode()).hexdigest()[:16]
+            ))
+        
+        return modules
+    
     def save_module(self, module: MSYModule):
-        """Sauvegarde module sur Triple Path"""
-        module_data = asdict(module)
+        """Sauvegarde module sur Triple Path (attend les 3 cibles)"""
+        self.writer.write([module])
+        self.record_aggregates([module])
+    
+    def save_modules(self, modules: List[MSYModule], fitness: Optional[np.ndarray] = None):
+        """Sauvegarde un lot sur Triple Path (asynchrone, rapports au cycle suivant)"""
+        self.writer.submit(modules)
+        self.record_aggregates(modules, fitness)
+    
+    def record_aggregates(self, modules: List[MSYModule], fitness: Optional[np.ndarray] = None):
+        """Met à jour les agrégats (fitness recalculée si non fournie)"""
+        if self.aggregates is None or not modules:
+            return
+        
+        if fitness is None:
+            fitness = self.calculate_fitness_population(modules)
+        self.aggregates.add(modules, fitness)
+    
+    def save_aggregates(self):
+        """Persiste les agrégats modifiés (remplacement atomique)"""
+        if self.aggregates is None:
+            return
+        
+        try:
+            self.aggregates.save()
+        except OSError as e:
+            print(f"⚠️  Agrégats non sauvegardés: {e}")
+    
+    def rebuild_aggregates(self, target: str = "G", batch_size: int = 10_000) -> int:
+        """
+        Reconstruit les agrégats depuis l'historique d'une cible. Fitness de
+        chaque module calculée à sa date de création, comme à l'enregistrement
+        incrémental. Moteur arrêté requis (verrou des agrégats, RuntimeError sinon).
+        """
+        if self.aggregates is None:
+            raise RuntimeError(f"{self.aggregates_error or 'Agrégats indisponibles'} : arrêter le moteur avant rebuild-aggregates")
         
-        # Sauvegarder sur les 3 chemins
-        for path_name, path_dir in TRIPLE_PATH.items():
-            module_file = path_dir / f"{module.id}.json"
+        self.aggregates.data = empty_aggregates(self.aggregates.data["fitness_bins"])
+        batch = []
+        count = 0
+        
+        backend = self.config.get('storage', {}).get('backend', 'files')
+        for module in iter_modules(self.triple_path[target], backend=backend):
+            batch.append(module)
+            if len(batch) >= batch_size:
+                self.record_aggregates(batch, self.calculate_fitness_population(batch, at_creation=True))
+                count += len(batch)
+                batch = []
+        
+        self.record_aggregates(batch, self.calculate_fitness_population(batch, at_creation=True))
+        count += len(batch)
+        self.aggregates.dirty = True
+        self.save_aggregates()
+        
+        return count
+    
+    def report_replication(self, timeout: Optional[float] = 0):
+        """Affiche latence / échecs des lots Triple Path terminés"""
+        for report in self.writer.collect(timeout):
+            if self.profiler.enabled:
+                self.profiler.observe(f"triple_path_{report['target']}", report['latency_ms'] / 1000)
             
-            with open(module_file, 'w') as f:
-                json.dump(module_data, f, indent=2)
+            status = "✅" if not report['failed'] else "⚠️ "
+            print(f"   {status} Triple Path {report['target']}: {report['written']} écrits, "
+                  f"{report['failed']} échecs, {report['latency_ms']:.1f} ms")
+            
+            for error in report['errors'][:3]:
+                print(f"      ❌ {error}")
+        
+        if self.writer.pending:
+            print(f"   ⏳ {len(self.writer.pending)} écritures Triple Path en cours")
+        
+        self.stats['triple_path'] = self.writer.snapshot_stats()
+    
+    def import_legacy_modules(self) -> Dict[str, int]:
+        """
+        Import unique des fichiers {id}.json de chaque cible dans son store
+        segments. Refusé si le moteur écrit encore en fichiers (storage.backend) :
+        les modules suivants n'iraient jamais dans le store.
+        """
+        backend = self.config.get('storage', {}).get('backend', 'files')
+        if backend != "segments":
+            raise RuntimeError(
+                f"storage.backend = \"{backend}\" dans {self.config_file} : arrêter le moteur, "
+                "passer storage.backend à \"segments\", puis relancer import-legacy"
+            )
+        
+        imported = {}
+        
+        for name, path_dir in self.triple_path.items():
+            imported[name] = self.writer.store(name, blocking=False).import_files(path_dir)
+            print(f"   ✅ Triple Path {name}: {imported[name]} modules importés")
+        
+        return imported
+    
+    def compact_stores(self) -> Dict[str, Dict[str, int]]:
+        """Compaction des stores segments de chaque cible"""
+        results = {}
         
-        # Log
-        log_file = MSY_LOGS_DIR / f"genesy_{datetime.now():%Y%m%d}.log"
+        for name in self.triple_path:
+            results[name] = self.writer.store(name, blocking=False).compact()
+            print(f"   ✅ Triple Path {name}: {results[name]['modules']} modules, "
+                  f"{results[name]['bytes_before']} → {results[name]['bytes_after']} octets")
         
-        with open(log_file, 'a') as f:
-            f.write(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] Module généré: {module.id} | Level: {module.level} | Genes: {len(module.genes)}\n")
+        return results
     
-    def sync_to_github(self, modules: List[MSYModule]):
+    def sync_to_github(self, modules: List[MSYModule], stats: Optional[Dict] = None):
         """Synchronisation GitHub"""
+        stats = stats if stats is not None else self.stats
+        self.load_msy_env()
+        
         if not self.github_token:
             print("⚠️  GitHub token manquant - sync skip")
             return
@@ -384,70 +2780,142 @@ class MSYGenesyEngine:
             "timestamp": datetime.now().isoformat(),
             "modules_count": len(modules),
             "top_modules": [asdict(m) for m in modules[:5]],
-            "stats": self.stats,
+            "stats": stats,
             "vision_2030_progress": {
-                "modules": f"{self.stats['modules_generated']}/2000",
-                "percentage": f"{(self.stats['modules_generated']/2000)*100:.2f}%"
+                "modules": f"{stats['modules_generated']}/2000",
+                "percentage": f"{(stats['modules_generated']/2000)*100:.2f}%"
             }
         }
         
         # Sauvegarder rapport
-        report_file = TRIPLE_PATH['I'] / f"genesy_report_{datetime.now():%Y%m%d_%H%M%S}.json"
+        report_file = self.triple_path['I'] / f"genesy_report_{datetime.now():%Y%m%d_%H%M%S}.json"
+        report_file.parent.mkdir(parents=True, exist_ok=True)
         
         with open(report_file, 'w') as f:
             json.dump(report, f, indent=2)
         
         print(f"✅ Rapport GENESY: {report_file}")
         
-        # TODO: Push GitHub (si API configurée)
+        # Push GitHub : rapport + modules du cycle en un commit (thread de fond)
+        if self.github is None:
+            return
+        
+        files = {f"reports/{report_file.name}": json.dumps(report, indent=2)}
+        for module in modules:
+            files[f"modules/level_{module.level}/{module.id}.json"] = json.dumps(asdict(module), indent=2)
+        
+        if self.github.submit(files, f"🧬 GENESY cycle #{stats['evolution_cycles']} : {len(modules)} modules"):
+            print(f"📤 Commit GitHub planifié ({len(files)} fichiers)")
+    
+    def persist_cycle(self, modules: List[MSYModule], stats: Dict):
+        """Persistance de fin de cycle (thread de persistance) : stats puis rapport + GitHub"""
+        with self.profiler.stage("stats"):
+            self.save_stats(stats)
+            self.save_aggregates()
+        
+        print("\n📦 Synchronisation GitHub...")
+        with self.profiler.stage("github"):
+            self.sync_to_github(modules, stats)
+    
+    def wait_persistence(self):
+        """Attend la persistance du cycle précédent (au plus un cycle en vol)"""
+        if self.persist_future is None:
+            return
+        
+        try:
+            self.persist_future.result()
+        except Exception as e:
+            print(f"⚠️  Persistance du cycle précédent échouée: {e}")
+        self.persist_future = None
     
     def run_evolution_cycle(self):
         """Exécute un cycle d'évolution complet"""
+        cycle_start = time.perf_counter()
+        
+        # Config rechargée à chaud (profileur reconstruit seulement entre cycles)
+        self.population = self.reload_config(self.population)
+        if self.config.get('profiling', {}) != self.profiling_config:
+            self.profiler = self.evolver.profiler = self.build_profiler()
+        self.profiler.start_cycle()
+        
         print(f"\n{'='*80}")
         print(f"🧬 MSY GENESY - Cycle Évolution #{self.stats['evolution_cycles'] + 1}")
         print(f"{'='*80}\n")
         
-        # Génération initiale
-        print("🔬 Génération population initiale...")
-        population = []
+        # Population conservée entre cycles
+        islands = self.config['evolution_params'].get('islands', {}).get('count', 1)
         
-        for _ in range(self.config['evolution_params']['generation_size']):
-            level = random.randint(1, 8)
-            module = self.generate_module(level)
-            population.append(module)
-        
-        print(f"   ✅ {len(population)} modules créés")
-        
-        # Évolution
-        print("\n🧬 Évolution génétique...")
-        evolved_population = self.evolve_generation(population)
+        if islands > 1:
+            # Évolution en îles (population répartie ou générée par île)
+            print(f"🏝️  Évolution multi-cœurs : {islands} îles...")
+            with self.profiler.stage("evolve"):
+                self.population = self.run_islands(self.population)
+        else:
+            if self.population is None:
+                print("🔬 Génération population initiale...")
+                with self.profiler.stage("generate"):
+                    self.population = self.generate_population(self.config['evolution_params']['generation_size'])
+                
+                print(f"   ✅ {len(self.population)} modules créés")
+            
+            # Évolution
+            print("\n🧬 Évolution génétique...")
+            with self.profiler.stage("evolve"):
+                self.population = self.evolve_generations(self.population)
         
-        print(f"   ✅ {len(evolved_population)} modules évoluésés")
+        print(f"   ✅ {self.last_evolution['generations']} générations (arrêt : {self.last_evolution['stop']})")
+        print(f"   ✅ {len(self.population)} modules évoluésés")
         print(f"   🧬 {self.stats['genes_mutated']} mutations totales")
         
-        # Sauvegarder meilleurs modules
+        # Sauvegarder meilleurs modules (jamais deux fois le même)
         print("\n💾 Sauvegarde modules...")
         
-        fitness_scores = [(m, self.calculate_fitness(m)) for m in evolved_population]
-        fitness_scores.sort(key=lambda x: x[1], reverse=True)
+        with self.profiler.stage("score"):
+            fitness = self.evolver.score(self.population)
+        
+        with self.profiler.stage("select"):
+            top_indices = [i for i in self.top_candidates(self.population, fitness) if fitness[i] >= self.config['evolution_params']['fitness_threshold']]
         
-        top_modules = [m for m, f in fitness_scores[:10] if f >= self.config['evolution_params']['fitness_threshold']]
+        with self.profiler.stage("materialize"):
+            top_modules = self.materialize_modules(self.population, top_indices)
+            self.population.saved[top_indices] = True
         
-        for module in top_modules:
-            self.save_module(module)
+        with self.profiler.stage("triple_path_submit"):
+            self.save_modules(top_modules, fitness[top_indices])
         
         print(f"   ✅ {len(top_modules)} modules sauvegardés (fitness > 80%)")
+        self.report_replication()
         
         # Stats
         self.stats['modules_generated'] += len(top_modules)
         self.stats['evolution_cycles'] += 1
         self.stats['vision_2030_progress'] = (self.stats['modules_generated'] / 2000) * 100
+        self.stats['last_run'] = datetime.now().isoformat()
+        if self._github is not None:
+            self.stats['github'] = dict(self._github.stats)
         
-        self.save_stats()
+        # Checkpoint (écriture en arrière-plan)
+        if self.stats['evolution_cycles'] % self.config.get('checkpoint', {}).get('interval_cycles', 1) == 0:
+            with self.profiler.stage("checkpoint"):
+                self.save_checkpoint()
         
-        # Sync GitHub
-        print("\n📦 Synchronisation GitHub...")
-        self.sync_to_github(top_modules)
+        # Stats + rapport + sync GitHub : pipelinés avec le cycle suivant
+        self.wait_persistence()
+        self.persist_future = self.persistence.submit(self.persist_cycle, top_modules, copy.deepcopy(self.stats))
+        
+        # Compteurs live + événement de fin de cycle
+        if self.events:
+            self.events.publish(
+                "cycle", self.stats['evolution_cycles'], self.stats.get('evolution_generations', 0),
+                float(fitness.max()) if len(fitness) else 0.0, float(fitness.mean()) if len(fitness) else 0.0,
+                self.stats['genes_mutated'], len(top_modules)
+            )
+        
+        if self.metrics:
+            self.metrics.publish(
+                self.stats['modules_generated'], self.stats['genes_mutated'], self.stats['evolution_cycles'],
+                (time.perf_counter() - cycle_start) * 1000, float(fitness.max()) if len(fitness) else 0.0
+            )
         
         # Résumé
         print(f"\n{'='*80}")
@@ -458,9 +2926,68 @@ class MSYGenesyEngine:
         print(f"  Mutations totales       : {self.stats['genes_mutated']}")
         print(f"  Progress Vision 2030    : {self.stats['vision_2030_progress']:.2f}%")
         print(f"{'='*80}\n")
+        
+        # Profilage : durées par étape, top fonctions, export Prometheus
+        if self.profiler.enabled:
+            self.profiler.observe("cycle", time.perf_counter() - cycle_start)
+            
+            durations = self.profiler.last_durations()
+            print("⏱️  Étapes : " + " | ".join(f"{name} {seconds * 1000:.1f} ms" for name, seconds in sorted(durations.items())))
+            
+            for function, samples in self.profiler.end_cycle():
+                print(f"   🔥 {samples:5d} {function}")
+            
+            self.profiler.write_prometheus(self.stats)
     
-    def run_continuous(self, interval_seconds: int = 300):
-        """Exécution continue"""
+    def next_interval(self, interval: float, base: float) -> float:
+        """
+        Intervalle du cycle suivant (config 'scheduler', adaptive) : allongé
+        sur plateau ou machine chargée, raccourci quand le seuil de fitness
+        est atteint plus vite qu'au cycle précédent (moins de générations),
+        sinon ramené vers l'intervalle de base. Un seuil atteint en autant
+        de générations que d'habitude (1 avec la config par défaut) est le
+        régime normal : il ne raccourcit pas l'intervalle.
+        """
+        scheduler = self.config.get('scheduler', {})
+        evolution = self.last_evolution or {}
+        previous, self.previous_generations = self.previous_generations, evolution.get('generations')
+        if not scheduler.get('adaptive', False):
+            return base
+        
+        backoff = scheduler.get('backoff', 1.5)
+        stop = evolution.get('stop')
+        load = os.getloadavg()[0] / (os.cpu_count() or 1) if hasattr(os, 'getloadavg') else 0.0
+        
+        if stop == "plateau" or load > scheduler.get('max_load', 1.0):
+            interval *= backoff
+        elif stop == "fitness_threshold" and previous is not None and evolution['generations'] < previous:
+            interval /= backoff
+        else:
+            interval = (interval + base) / 2
+        
+        return min(max(interval, scheduler.get('min_interval_seconds', 60)), scheduler.get('max_interval_seconds', 1800))
+    
+    def request_stop(self, signum=None, frame=None):
+        """Arrêt propre demandé (SIGTERM Docker) : fin après le cycle en cours"""
+        print(f"\n🛑 Signal {signum} reçu : arrêt après le cycle en cours")
+        self.stop_event.set()
+    
+    def run_continuous(self, interval_seconds: Optional[float] = None):
+        """
+        Exécution continue à cadence fixe.
+        
+        Les cycles démarrent toutes les `interval_seconds` (sans dérive :
+        la durée du cycle est prise sur l'intervalle ; créneaux manqués
+        sautés). SIGTERM et Ctrl+C arrêtent proprement : persistance
+        terminée, checkpoint final ; les écritures sont vidées par close()
+        de l'appelant (main), appelé une seule fois.
+        """
+        base = float(interval_seconds or self.config.get('scheduler', {}).get('interval_seconds', 300))
+        interval = base
+        
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, self.request_stop)
+        
         print("""
 ╔═══════════════════════════════════════════════════════════════════════════╗
 ║                                                                           ║
@@ -471,21 +2998,88 @@ class MSYGenesyEngine:
 ╚═══════════════════════════════════════════════════════════════════════════╝
         """)
         
+        next_run = time.monotonic()
+        
         try:
-            while True:
+            while not self.stop_event.is_set():
                 self.run_evolution_cycle()
                 
-                print(f"⏸️  Pause {interval_seconds}s avant prochain cycle...\n")
-                time.sleep(interval_seconds)
+                if not interval_seconds:
+                    base = float(self.config.get('scheduler', {}).get('interval_seconds', 300))
+                interval = self.next_interval(interval, base)
+                next_run += interval
+                now = time.monotonic()
+                
+                if next_run < now:
+                    skipped = int((now - next_run) // interval) + 1
+                    next_run += skipped * interval
+                    print(f"⚠️  Cycle plus long que l'intervalle : {skipped} créneau(x) sauté(s)")
+                
+                print(f"⏸️  Prochain cycle dans {next_run - now:.0f}s (cadence {interval:.0f}s)...\n")
+                self.stop_event.wait(next_run - now)
                 
         except KeyboardInterrupt:
+            pass
+        finally:
             print("\n\n🛑 MSY GENESY arrêté proprement")
+            self.wait_persistence()
+            self.save_checkpoint(wait=True)
             print(f"📊 Stats finales:")
             print(f"   Modules: {self.stats['modules_generated']}")
             print(f"   Cycles: {self.stats['evolution_cycles']}")
             print(f"   Vision 2030: {self.stats['vision_2030_progress']:.2f}%")
             print("\n💎 NOUS NE SOMMES PAS DES CONCURRENTS MAIS DES CONTRIBUTEURS\n")
 
+def export_command(args) -> int:
+    """Commande export : flux des modules d'une cible vers un fichier ou stdout"""
+    target_dir = resolve_triple_path()[args.target]
+    count = 0
+    
+    if not target_dir.is_dir():
+        print(f"❌ Cible Triple Path absente : {target_dir}", file=sys.stderr)
+        sys.exit(1)
+    
+    # Backend du moteur (config sans section storage = fichiers ; config absente = inconnu)
+    try:
+        config = CONFIG_CACHE.load(MSY_GENESY_DIR / "msy_genesy_config.json", json.load)
+    except ValueError:
+        config = None
+    backend = config.get('storage', {}).get('backend', 'files') if isinstance(config, dict) else None
+    
+    try:
+        source = resolve_source(target_dir, args.source, backend)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+    
+    if source == "store" and not (target_dir / "store" / "index.sqlite3").exists():
+        print(f"❌ Aucun store segments dans {target_dir}", file=sys.stderr)
+        sys.exit(1)
+    
+    def counted(modules):
+        nonlocal count
+        for module in modules:
+            count += 1
+            yield module
+    
+    modules = iter_modules(
+        target_dir, source, raw=args.format == "jsonl",
+        level=args.level, gene=args.gene, status=args.status, since=args.since, until=args.until
+    )
+    output = sys.stdout.buffer if args.output == "-" else open(args.output, 'wb')
+    
+    try:
+        for chunk in export_modules(counted(modules), args.format, args.gzip):
+            output.write(chunk)
+    finally:
+        if output is not sys.stdout.buffer:
+            output.close()
+        else:
+            output.flush()
+    
+    print(f"📤 {count} modules exportés depuis {target_dir}", file=sys.stderr)
+    return count
+
 def main():
     """Point d'entrée"""
     
@@ -494,9 +3088,60 @@ def main():
         print("❌ Python 3.7+ requis")
         sys.exit(1)
     
-    # Lancer GENESY
+    parser = argparse.ArgumentParser(description="MSY GENESY V2025 - Générateur IA Évolutif")
+    parser.add_argument(
+        "command", nargs="?", default="run", choices=["run", "import-legacy", "compact", "export", "rebuild-aggregates"],
+        help="run = production continue, import-legacy = fichiers {id}.json → store, "
+             "compact = compaction store, export = historique en JSON Lines / CSV, "
+             "rebuild-aggregates = agrégats recalculés depuis l'historique (--target)"
+    )
+    export = parser.add_argument_group("export")
+    export.add_argument("--format", choices=EXPORT_FORMATS, default="jsonl")
+    export.add_argument("--gzip", action="store_true", help="Compression gzip à la volée")
+    export.add_argument("--output", default="-", help="Fichier de sortie (défaut: stdout)")
+    export.add_argument("--target", choices=sorted(TRIPLE_PATH_CANDIDATES), default="G", help="Cible Triple Path lue")
+    export.add_argument("--source", choices=["auto", "store", "files"], default="auto")
+    export.add_argument("--level", type=int)
+    export.add_argument("--gene")
+    export.add_argument("--status")
+    export.add_argument("--since", help="created_at >= (ISO, ex. 2025-01-01)")
+    export.add_argument("--until", help="created_at < (ISO)")
+    args = parser.parse_args()
+    
+    if args.command == "export":
+        # Sans moteur : stdout est réservé aux données exportées
+        export_command(args)
+        return
+    
     genesy = MSYGenesyEngine()
-    genesy.run_continuous(interval_seconds=300)  # Cycle toutes les 5 min
+    
+    if args.command in ("import-legacy", "compact"):
+        try:
+            if args.command == "import-legacy":
+                print("📥 Import modules existants → store segments...")
+                genesy.import_legacy_modules()
+            else:
+                print("🗜️  Compaction store segments...")
+                genesy.compact_stores()
+        except RuntimeError as e:
+            # Store tenu par le moteur : échec immédiat
+            print(f"❌ {e}")
+            genesy.close()
+            sys.exit(1)
+    elif args.command == "rebuild-aggregates":
+        print(f"📊 Reconstruction des agrégats (Triple Path {args.target})...")
+        try:
+            print(f"   ✅ {genesy.rebuild_aggregates(args.target)} modules agrégés")
+        except RuntimeError as e:
+            # Agrégats tenus par le moteur : échec immédiat
+            print(f"❌ {e}")
+            genesy.close()
+            sys.exit(1)
+    else:
+        # Lancer GENESY
+        genesy.run_continuous()  # Cadence config 'scheduler' (5 min par défaut)
+    
+    genesy.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file